@@ -1,23 +1,170 @@
 cat > App/Routers/Contacts.py << 'EOF'
-from fastapi import APIRouter, HTTPException
-from typing import List, Optional
-from ..Schemas import Contact, Interaction, PrioritizeRequest, ScheduleRequest
-from ..services.prioritization import ContactPrioritization
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from typing import Iterator, List, Optional
+from datetime import datetime, timedelta
+import asyncpg
+import numpy as np
+from ..Schemas import (
+    Contact,
+    Interaction,
+    PrioritizeRequest,
+    ScheduleRequest,
+    ScoreStoreSyncRequest,
+    WarmthBatchRequest,
+)
+from ..services.prioritization import (
+    RELATIONSHIP_CODES,
+    ContactColumns,
+    ContactPrioritization,
+    top_k_indices,
+)
+from ..services.interaction_index import InteractionIndex
+from ..services.score_store import PriorityScoreStore, ScoreStoreRegistry
+from ..services.sharding import get_sharded_prioritizer
+from ..services.bulk_decode import (
+    BulkDecodeError,
+    ColumnarBatch,
+    decode_columnar_upload,
+    decode_prioritize_payload,
+    decode_schedule_payload,
+)
+from ..Config import settings
+from ..db import (
+    get_db,
+    insert_contact,
+    insert_interaction,
+    fetch_contact_aggregates,
+    save_score_store_changes,
+    load_score_store_changes,
+)
+from ..pagination import encode_cursor, decode_cursor
+from ..encoding import RowsResponse
 
 router = APIRouter(prefix="/contacts", tags=["Contact Management"])
 
 prioritizer = ContactPrioritization()
+score_stores = ScoreStoreRegistry(prioritizer)
+
+# Contacts serialized per chunk of a streamed NDJSON response
+STREAM_CHUNK_SIZE = 256
+
+def _ndjson_lines(contacts: List[Contact]) -> Iterator[str]:
+    """Serialize contacts one JSON document per line, in small chunks"""
+    chunk = []
+    for contact in contacts:
+        chunk.append(contact.model_dump_json())
+        if len(chunk) >= STREAM_CHUNK_SIZE:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+async def _prioritize(contacts, interactions, limit):
+    if len(contacts) >= settings.prioritization_shard_threshold:
+        # Large networks are scored in worker processes off the event loop
+        return await get_sharded_prioritizer().prioritize_contacts(
+            contacts,
+            interactions,
+            limit
+        )
+    return prioritizer.prioritize_contacts(contacts, interactions, limit)
+
+# -------- Request body formats --------
+# /prioritize and /schedule accept either the JSON request models or a
+# multipart upload of CSV columns ("contacts" and optional "interactions"
+# files, other parameters as form fields) that is decoded straight into
+# the scoring arrays.
+
+def _is_columnar(http_request: Request) -> bool:
+    return http_request.headers.get("content-type", "").startswith("multipart/form-data")
+
+async def _parse_json_body(http_request: Request, model: type[BaseModel]):
+    try:
+        return model.model_validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+
+async def _read_columnar_upload(http_request: Request) -> tuple[ColumnarBatch, dict]:
+    form = await http_request.form()
+    
+    async def text(name):
+        part = form.get(name)
+        if part is None or isinstance(part, str):
+            return part
+        return (await part.read()).decode("utf-8-sig")
+    
+    contacts_csv = await text("contacts")
+    if not contacts_csv:
+        raise HTTPException(status_code=422, detail="contacts: CSV file required")
+    
+    try:
+        batch = decode_columnar_upload(contacts_csv, await text("interactions"))
+    except BulkDecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    fields = {}
+    for name, value in form.multi_items():
+        if isinstance(value, str):
+            fields[name] = value
+    return batch, fields
+
+def _form_int(fields: dict, name: str, default: Optional[int] = None, minimum: int = 1) -> Optional[int]:
+    value = fields.get(name)
+    if value in (None, ""):
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = None
+    if number is None or number < minimum:
+        raise HTTPException(status_code=422, detail=f"{name}: expected an integer >= {minimum}")
+    return number
+
+def _rank_columnar(batch: ColumnarBatch, limit: Optional[int]) -> list[dict]:
+    scores = prioritizer.score_columns(batch.columns)
+    top = top_k_indices(scores, limit)
+    return [batch.row(i, s) for i, s in zip(top.tolist(), scores[top].tolist())]
 
 @router.post("/prioritize")
-async def prioritize_contacts(request: PrioritizeRequest):
-    """Prioritize contacts for outreach using smart scoring"""
+async def prioritize_contacts(
+    http_request: Request,
+    stream: bool = Query(False, description="Stream contacts as NDJSON (JSON bodies)")
+):
+    """Prioritize contacts for outreach using smart scoring
+    
+    Body: a PrioritizeRequest as JSON, or multipart CSV columns
+    (see _read_columnar_upload) with an optional `limit` form field.
+    """
+    if _is_columnar(http_request):
+        batch, fields = await _read_columnar_upload(http_request)
+        limit = _form_int(fields, "limit")
+        try:
+            return {
+                "status": "success",
+                "total_contacts": len(batch),
+                "prioritized_contacts": _rank_columnar(batch, limit)
+            }
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    request = await _parse_json_body(http_request, PrioritizeRequest)
     try:
-        prioritized = prioritizer.prioritize_contacts(
+        prioritized = await _prioritize(
             request.contacts,
             request.interactions,
             request.limit
         )
         
+        if stream:
+            return StreamingResponse(
+                _ndjson_lines(prioritized),
+                media_type="application/x-ndjson",
+                headers={"X-Total-Contacts": str(len(request.contacts))}
+            )
+        
         return {
             "status": "success",
             "total_contacts": len(request.contacts),
@@ -27,50 +174,358 @@ async def prioritize_contacts(request: PrioritizeRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/schedule")
-async def generate_schedule(request: ScheduleRequest):
-    """Generate weekly outreach schedule"""
+async def generate_schedule(http_request: Request):
+    """Generate weekly outreach schedule
+    
+    Body: a ScheduleRequest as JSON, or multipart CSV columns with
+    `contacts_per_week`, `weeks` and `cursor` form fields.
+    
+    Set `weeks` (and then `cursor` from the previous response) to page
+    through the schedule instead of building every week at once.
+    """
+    if _is_columnar(http_request):
+        batch, fields = await _read_columnar_upload(http_request)
+        contacts_per_week = _form_int(fields, "contacts_per_week", 5)
+        weeks = _form_int(fields, "weeks")
+        try:
+            return _schedule_columnar(batch, contacts_per_week, weeks, fields.get("cursor"))
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    request = await _parse_json_body(http_request, ScheduleRequest)
     try:
-        schedule = prioritizer.generate_outreach_schedule(
+        return _schedule(
             request.contacts,
             request.interactions,
-            request.contacts_per_week
+            request.contacts_per_week,
+            request.weeks,
+            request.cursor
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _schedule(contacts, interactions, contacts_per_week, weeks=None, cursor=None) -> dict:
+    if weeks or cursor:
+        return _schedule_page(contacts, interactions, contacts_per_week, weeks, cursor)
+    
+    schedule = prioritizer.generate_outreach_schedule(
+        contacts,
+        interactions,
+        contacts_per_week
+    )
+    
+    # Convert to serializable format
+    schedule_dict = {
+        week: [c.dict() for c in week_contacts]
+        for week, week_contacts in schedule.items()
+    }
+    
+    return {
+        "status": "success",
+        "weeks": len(schedule),
+        "total_contacts": len(contacts),
+        "schedule": schedule_dict
+    }
+
+def _decode_schedule_cursor(cursor: Optional[str]) -> tuple[int, datetime]:
+    """(first week, schedule start); the cursor pins the start date across pages"""
+    if not cursor:
+        return 0, datetime.now()
+    try:
+        state = decode_cursor(cursor)
+        return int(state["week"]), datetime.fromisoformat(state["start"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _next_schedule_cursor(first_week: int, weeks: int, start: datetime) -> str:
+    return encode_cursor({
+        "week": first_week + weeks,
+        "start": start.isoformat()
+    })
+
+def _schedule_page(contacts, interactions, contacts_per_week, weeks, cursor) -> dict:
+    """One page of the outreach schedule"""
+    first_week, start = _decode_schedule_cursor(cursor)
+    weeks = weeks or 4
+    page, has_more = prioritizer.outreach_schedule_page(
+        contacts,
+        interactions,
+        contacts_per_week,
+        weeks,
+        first_week,
+        start
+    )
+    
+    next_cursor = None
+    if has_more:
+        next_cursor = _next_schedule_cursor(first_week, weeks, start)
+    
+    return {
+        "status": "success",
+        "weeks": len(page),
+        "total_contacts": len(contacts),
+        "schedule": {
+            week: [c.dict() for c in week_contacts]
+            for week, week_contacts in page
+        },
+        "next_cursor": next_cursor
+    }
+
+def _schedule_columnar(batch: ColumnarBatch, contacts_per_week, weeks, cursor) -> dict:
+    """Outreach schedule (full or one page) for a columnar upload"""
+    paged = bool(weeks or cursor)
+    first_week, start = _decode_schedule_cursor(cursor)
+    weeks = weeks or 4
+    
+    needed = (first_week + weeks) * contacts_per_week if paged else None
+    rows = _rank_columnar(batch, needed)
+    schedule = dict(prioritizer.iter_outreach_weeks(rows, contacts_per_week, start, first_week))
+    
+    response = {
+        "status": "success",
+        "weeks": len(schedule),
+        "total_contacts": len(batch),
+        "schedule": schedule
+    }
+    if paged:
+        has_more = len(batch) > needed
+        response["next_cursor"] = _next_schedule_cursor(first_week, weeks, start) if has_more else None
+    return response
+
+# -------- Bulk fast-ingest endpoints --------
+# Same request and response shapes as /prioritize and /schedule, but the body
+# is decoded straight into compact records: only the fields scoring reads are
+# checked, and each contact is echoed back as sent plus its priority_score.
+
+@router.post("/prioritize/bulk")
+async def prioritize_contacts_bulk(request: Request):
+    """Prioritize a large contact upload without full model validation"""
+    try:
+        payload = decode_prioritize_payload(await request.body())
+    except BulkDecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    try:
+        prioritized = await _prioritize(
+            payload["contacts"],
+            payload["interactions"],
+            payload["limit"]
         )
-        
-        # Convert to serializable format
-        schedule_dict = {
-            week: [c.dict() for c in contacts]
-            for week, contacts in schedule.items()
-        }
         
         return {
             "status": "success",
-            "weeks": len(schedule),
-            "total_contacts": len(request.contacts),
-            "schedule": schedule_dict
+            "total_contacts": len(payload["contacts"]),
+            "prioritized_contacts": [c.dict() for c in prioritized]
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/schedule/bulk")
+async def generate_schedule_bulk(request: Request):
+    """Generate an outreach schedule for a large upload without full model validation"""
+    try:
+        payload = decode_schedule_payload(await request.body())
+    except BulkDecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    try:
+        return _schedule(**payload)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/calculate-warmth")
 async def calculate_warmth(contact: Contact, interactions: List[Interaction]):
     """Calculate relationship warmth score for a contact"""
     try:
-        warmth = prioritizer.calculate_warmth_score(contact, interactions)
-        
-        # Update warmth bucket
-        if warmth >= 70:
-            bucket = "hot"
-        elif warmth >= 40:
-            bucket = "warm"
-        else:
-            bucket = "cold"
+        warmth = prioritizer.calculate_warmth_score(
+            contact,
+            InteractionIndex(interactions)
+        )
         
         return {
             "status": "success",
             "contact": contact.name,
             "warmth_score": warmth,
-            "warmth_bucket": bucket
+            "warmth_bucket": prioritizer.warmth_bucket(warmth)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/calculate-warmth/batch")
+async def calculate_warmth_batch(request: WarmthBatchRequest):
+    """Calculate warmth scores for many contacts against one shared interaction set"""
+    try:
+        scores = prioritizer.calculate_warmth_scores(
+            request.contacts,
+            request.interactions
+        )
+        
+        results = []
+        bucket_counts = {"hot": 0, "warm": 0, "cold": 0}
+        for contact, warmth in zip(request.contacts, scores):
+            bucket = prioritizer.warmth_bucket(warmth)
+            bucket_counts[bucket] += 1
+            results.append({
+                "id": contact.id,
+                "contact": contact.name,
+                "warmth_score": warmth,
+                "warmth_bucket": bucket
+            })
+        
+        return {
+            "status": "success",
+            "total_contacts": len(request.contacts),
+            "buckets": bucket_counts,
+            "results": results
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# -------- Incremental score store --------
+# Synced contacts and interactions are persisted per owner in Postgres; each
+# worker keeps an in-memory PriorityScoreStore per owner and replays the
+# changes it has not seen before answering, so workers and restarts agree.
+
+def _store_owner(
+    owner: str = Header(
+        "default",
+        alias="X-Owner-Id",
+        min_length=1,
+        max_length=128,
+        description="Whose score store to use (a scope, not authentication)"
+    )
+) -> str:
+    return owner
+
+async def _caught_up_store(db: asyncpg.Connection, owner: str) -> PriorityScoreStore:
+    """The owner's store after replaying persisted changes it has not seen"""
+    async with score_stores.lock(owner):
+        store = score_stores.get(owner)
+        version, contacts, interactions = await load_score_store_changes(db, owner, store.version)
+        store.upsert_contacts(Contact.model_validate_json(c) for c in contacts)
+        store.log_interactions(Interaction.model_validate_json(i) for i in interactions)
+        store.version = version
+        return store
+
+@router.post("/priority-store/sync")
+async def sync_priority_store(
+    request: ScoreStoreSyncRequest,
+    owner: str = Depends(_store_owner),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """Upsert contacts and log new interactions; only changed contacts are re-scored"""
+    if any(contact.id is None for contact in request.contacts):
+        raise HTTPException(status_code=400, detail="Contacts in the score store need an id")
+    
+    try:
+        await save_score_store_changes(
+            db,
+            owner,
+            [(contact.id, contact.model_dump_json()) for contact in request.contacts],
+            [interaction.model_dump_json() for interaction in request.interactions or []]
+        )
+        store = await _caught_up_store(db, owner)
+        
+        return {
+            "status": "success",
+            "stored_contacts": len(store),
+            "pending_recompute": store.dirty_count,
+            "version": store.version
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/priority-store/ranked")
+async def ranked_from_store(
+    limit: Optional[int] = Query(None, ge=1),
+    owner: str = Depends(_store_owner),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """Read the ranked contact list from the incremental score store"""
+    try:
+        store = await _caught_up_store(db, owner)
+        ranked = store.ranked(limit)
+        next_due = store.next_due()
+        
+        return {
+            "status": "success",
+            "total_contacts": len(store),
+            "next_rescore_at": next_due.isoformat() if next_due else None,
+            "prioritized_contacts": [c.dict() for c in ranked]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# -------- Persisted contacts --------
+# Contacts and interactions stored in Postgres; /prioritized scores them
+# from the per-day interaction rollup, so no history crosses the wire.
+
+# Window for the sentiment mix reported next to each score (warmth uses the same)
+SENTIMENT_WINDOW_DAYS = 180
+
+@router.post("/", response_model=Contact)
+async def create_contact(contact: Contact, db: asyncpg.Connection = Depends(get_db)):
+    """Store a contact server-side"""
+    data = contact.model_dump(exclude={"id"})
+    data["relationship"] = contact.relationship.value if contact.relationship else None
+    data["source"] = contact.source.value
+    return await insert_contact(db, data)
+
+@router.post("/{contact_id}/interactions", response_model=Interaction)
+async def log_interaction(
+    contact_id: int,
+    interaction: Interaction,
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """Store an interaction and update the contact's aggregates"""
+    row = await insert_interaction(db, contact_id, interaction.model_dump(exclude={"id", "contact_id"}))
+    if row is None:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    return row
+
+@router.get("/prioritized")
+async def prioritized_from_db(
+    limit: Optional[int] = Query(50, ge=1),
+    db: asyncpg.Connection = Depends(get_db)
+):
+    """Rank stored contacts with the ContactPrioritization formula"""
+    now = datetime.now()
+    rows = await fetch_contact_aggregates(
+        db,
+        now - timedelta(days=365),
+        (now - timedelta(days=SENTIMENT_WINDOW_DAYS)).date()
+    )
+    
+    n = len(rows)
+    columns = ContactColumns(
+        np.array([r["last_interaction_date"] for r in rows], dtype="datetime64[us]"),
+        np.fromiter((RELATIONSHIP_CODES.get(r["relationship"], -1) for r in rows), dtype=np.int8, count=n),
+        np.fromiter((r["warmth_score"] for r in rows), dtype=np.float64, count=n),
+        np.fromiter((r["interactions_last_year"] for r in rows), dtype=np.int64, count=n)
+    )
+    scores = prioritizer.score_columns(columns, now)
+    top = top_k_indices(scores, limit)
+    
+    prioritized = []
+    for i, score in zip(top.tolist(), scores[top].tolist()):
+        contact = dict(rows[i])
+        contact["priority_score"] = score
+        contact["recent_sentiment"] = {
+            "positive": contact.pop("recent_positive"),
+            "neutral": contact.pop("recent_neutral"),
+            "negative": contact.pop("recent_negative")
+        }
+        prioritized.append(contact)
+    
+    return RowsResponse({
+        "status": "success",
+        "total_contacts": n,
+        "prioritized_contacts": prioritized
+    })
 EOF
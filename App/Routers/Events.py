@@ -1,19 +1,60 @@
 cat > App/Routers/Events.py << 'EOF'
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, List
-from datetime import datetime
-from ..services.eventbrite import EventbriteService
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional, List, Dict, Tuple
+from datetime import datetime, timedelta
+import asyncio
+from ..services.eventbrite import EventbriteService, get_eventbrite_service
+from ..services.event_index import EventIndex, get_event_index
 from ..Config import settings
 
 router = APIRouter(prefix="/events", tags=["Networking Events"])
 
+PAGE_SIZE = 50  # matches Eventbrite's page size
+
+def _geo_filter(lat: Optional[float], lon: Optional[float], radius_km: Optional[float]) -> Dict:
+    if (lat is None) != (lon is None):
+        raise HTTPException(status_code=422, detail="lat and lon must be given together")
+    if lat is None:
+        return {}
+    return {"lat": lat, "lon": lon, "radius_km": radius_km or 20.0}
+
+def _use_index(index: EventIndex, location: Optional[str], keywords: str, end: Optional[datetime]) -> bool:
+    # The index cannot geocode free-text locations, and only holds what its
+    # seed searches fetched; anything else goes to Eventbrite
+    return not location and index.covers(keywords, end)
+
 @router.get("/search")
 async def search_events(
     keywords: str = Query("networking", description="Search keywords"),
     location: Optional[str] = Query(None, description="City or address"),
-    page: int = Query(1, ge=1, le=50)
+    page: int = Query(1, ge=1, le=50),
+    lat: Optional[float] = Query(None, ge=-90, le=90, description="Latitude to search around"),
+    lon: Optional[float] = Query(None, ge=-180, le=180, description="Longitude to search around"),
+    radius_km: Optional[float] = Query(None, gt=0, le=500, description="Search radius (default 20 km)"),
+    days: Optional[int] = Query(None, ge=1, le=365, description="Only events starting within this many days"),
+    service: EventbriteService = Depends(get_eventbrite_service),
+    index: EventIndex = Depends(get_event_index)
 ):
-    """Search for networking events on Eventbrite"""
+    """Search for networking events, from the local index when it can answer"""
+    
+    geo = _geo_filter(lat, lon, radius_km)
+    now = datetime.now()
+    window = {"start": now, "end": now + timedelta(days=days)} if days else {}
+    
+    events = []
+    if _use_index(index, location, keywords, window.get("end")):
+        events = index.search(keywords=keywords, **window, **geo)
+    
+    if events:
+        offset = (page - 1) * PAGE_SIZE
+        return {
+            "status": "success",
+            "source": "index",
+            "total": len(events),
+            "page": page,
+            "has_more": offset + PAGE_SIZE < len(events),
+            "events": events[offset:offset + PAGE_SIZE]
+        }
     
     if not settings.has_eventbrite():
         raise HTTPException(
@@ -22,24 +63,34 @@ async def search_events(
         )
     
     try:
-        service = EventbriteService()
         results = await service.search_events(
             keywords=keywords,
             location=location,
+            end_date=window.get("end"),
             page=page
         )
         
+        events = results.get("events", [])
+        if geo or window:
+            # Same filters as the index, applied to this page only
+            events = EventIndex(events).search(**window, **geo)
+        
         return {
             "status": "success",
+            "source": "eventbrite",
             "total": results.get("total", 0),
             "page": page,
-            "events": results.get("events", [])
+            "has_more": results.get("has_more", False),
+            "events": events
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/details/{event_id}")
-async def get_event_details(event_id: str):
+async def get_event_details(
+    event_id: str,
+    service: EventbriteService = Depends(get_eventbrite_service)
+):
     """Get detailed information about a specific event"""
     
     if not settings.has_eventbrite():
@@ -49,7 +100,6 @@ async def get_event_details(event_id: str):
         )
     
     try:
-        service = EventbriteService()
         event = await service.get_event_details(event_id)
         
         if "error" in event:
@@ -64,47 +114,128 @@ async def get_event_details(event_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _fan_out_searches(
+    service: EventbriteService,
+    keywords: List[str],
+    location: Optional[str],
+    until: Optional[datetime] = None
+) -> Tuple[List[Dict], List[Dict]]:
+    """Search every keyword concurrently (bounded, with a total deadline)
+    
+    Each keyword streams up to events_per_interest events across result
+    pages, deduplicated by id as they arrive. Returns (unique_events, failed)
+    where failed lists the keywords that errored or did not finish before
+    the deadline; events they had already streamed are kept, so callers
+    can answer partially.
+    """
+    if not keywords:
+        return [], []
+    
+    semaphore = asyncio.Semaphore(settings.events_search_concurrency)
+    seen_ids = set()
+    unique_events: List[Dict] = []
+    
+    async def search(keyword):
+        async with semaphore:
+            async for event in service.iter_events(
+                keywords=keyword,
+                location=location,
+                until=until,
+                max_events=settings.events_per_interest
+            ):
+                if event["id"] not in seen_ids:
+                    seen_ids.add(event["id"])
+                    unique_events.append(event)
+    
+    tasks = {asyncio.create_task(search(keyword)): keyword for keyword in keywords}
+    done, pending = await asyncio.wait(tasks, timeout=settings.events_recommendation_deadline_seconds)
+    
+    failed = []
+    for task in pending:
+        task.cancel()
+        failed.append({"keyword": tasks[task], "error": "timed out"})
+    for task in done:
+        if task.exception() is not None:
+            e = task.exception()
+            failed.append({"keyword": tasks[task], "error": str(e) or type(e).__name__})
+    
+    return unique_events, failed
+
 @router.get("/recommendations")
 async def get_event_recommendations(
     location: Optional[str] = Query(None),
-    interests: Optional[str] = Query("technology,business,professional development")
+    interests: Optional[str] = Query("technology,business,professional development"),
+    days: int = Query(30, ge=1, le=365, description="Only events starting within this many days"),
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lon: Optional[float] = Query(None, ge=-180, le=180),
+    radius_km: Optional[float] = Query(None, gt=0, le=500, description="Search radius (default 20 km)"),
+    service: EventbriteService = Depends(get_eventbrite_service),
+    index: EventIndex = Depends(get_event_index)
 ):
     """Get curated event recommendations for networking"""
     
-    if not settings.has_eventbrite():
+    geo = _geo_filter(lat, lon, radius_km)
+    keywords = list(dict.fromkeys(k.strip() for k in (interests or "").split(",") if k.strip()))
+    if not keywords:
+        raise HTTPException(status_code=422, detail="interests must contain at least one keyword")
+    now = datetime.now()
+    until = now + timedelta(days=days)
+    
+    # Interests the index covers and has hits for are answered locally;
+    # the rest are searched live
+    index_events = []
+    live_keywords = []
+    for keyword in keywords:
+        hits = []
+        if _use_index(index, location, keyword, until):
+            hits = index.search(keywords=keyword, start=now, end=until, **geo)[:settings.events_per_interest]
+        if hits:
+            index_events.extend(hits)
+        else:
+            live_keywords.append(keyword)
+    
+    if live_keywords and not settings.has_eventbrite():
         return {
             "status": "info",
             "message": "Eventbrite API not configured. Configure it to get personalized event recommendations."
         }
     
     try:
-        service = EventbriteService()
+        # Search for multiple categories concurrently
+        live_events, failed = await _fan_out_searches(service, live_keywords, location, until)
+        
+        if failed and len(failed) == len(keywords):
+            raise HTTPException(status_code=502, detail={"message": "All event searches failed", "failed": failed})
         
-        # Search for multiple categories
-        all_events = []
-        for keyword in interests.split(","):
-            results = await service.search_events(
-                keywords=keyword.strip(),
-                location=location
-            )
-            all_events.extend(results.get("events", []))
+        if geo and live_events:
+            live_events = EventIndex(live_events).search(**geo)
         
-        # Remove duplicates
         seen_ids = set()
         unique_events = []
-        for event in all_events:
+        for event in index_events + live_events:
             if event["id"] not in seen_ids:
                 seen_ids.add(event["id"])
                 unique_events.append(event)
         
         # Sort by date
-        unique_events.sort(key=lambda e: e.get("start", ""))
+        unique_events.sort(key=lambda e: e.get("start") or "")
+        
+        if not live_keywords:
+            source = "index"
+        elif index_events:
+            source = "mixed"
+        else:
+            source = "eventbrite"
         
         return {
-            "status": "success",
+            "status": "partial" if failed else "success",
+            "source": source,
             "total": len(unique_events),
-            "events": unique_events[:20]  # Top 20
+            "events": unique_events[:20],  # Top 20
+            "failed_interests": failed
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 EOF
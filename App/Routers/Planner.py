@@ -1,19 +1,114 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from datetime import date, timedelta
+from typing import List, Literal, Optional
 import asyncpg
 
-from app.db import get_db
-from app.schemas import PlannerTask
+from app.db import (
+    get_db,
+    pooled_connection,
+    list_planner_tasks,
+    iter_planner_tasks,
+    list_due_planner_tasks,
+    bulk_update_planner_tasks,
+)
+from app.encoding import RowsResponse, dumps
+from app.pagination import encode_cursor, decode_cursor
+from app.schemas import PlannerTask, PlannerBulkRequest, PlannerBulkResponse
 
 router = APIRouter(prefix="/planner", tags=["planner"])
 
 @router.get("/tasks", response_model=List[PlannerTask])
-async def list_tasks(db: asyncpg.Connection = Depends(get_db)):
-    rows = await db.fetch("""
-        SELECT id, contact_id, action_type,
-               to_char(due_date, 'YYYY-MM-DD') AS due_date,
-               completed
-        FROM planner_tasks
-        ORDER BY due_date ASC;
-    """)
-    return [dict(r) for r in rows]
+async def list_tasks(
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: asyncpg.Connection = Depends(get_db),
+):
+    """
+    Tasks by due date (ties broken by id), one keyset page at a time.
+    The X-Next-Cursor header carries the cursor for the next page.
+    """
+    after = None
+    if cursor:
+        try:
+            data = decode_cursor(cursor)
+            after = (date.fromisoformat(data["due_date"]), int(data["id"]))
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    rows, next_after = await list_planner_tasks(db, limit, after)
+    headers = {}
+    if next_after is not None:
+        due_date, task_id = next_after
+        headers["X-Next-Cursor"] = encode_cursor({"due_date": due_date, "id": task_id})
+    # Rows come straight from typed columns: skip response_model re-validation
+    return RowsResponse(rows, headers=headers)
+
+
+@router.get("/tasks/export")
+async def export_tasks():
+    """
+    Every task as newline-delimited JSON, streamed from a server-side cursor.
+    """
+    async def lines():
+        async with pooled_connection() as conn:
+            async for row in iter_planner_tasks(conn):
+                yield dumps(row) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/tasks/due", response_model=List[PlannerTask])
+async def due_tasks(
+    scope: Literal["today", "overdue", "upcoming"] = "today",
+    days: int = Query(7, ge=1, le=366, description="Window for scope=upcoming"),
+    contact_id: Optional[int] = None,
+    as_of: Optional[date] = Query(None, description="Treat this date as today (client time zone)"),
+    limit: int = Query(100, ge=1, le=500),
+    db: asyncpg.Connection = Depends(get_db),
+):
+    """
+    Open tasks for the daily planner view:
+      today     due on as_of
+      overdue   due before as_of
+      upcoming  due in [as_of, as_of + days)
+    optionally for a single contact.
+    """
+    today = as_of or date.today()
+    if scope == "today":
+        start, end = today, today + timedelta(days=1)
+    elif scope == "overdue":
+        start, end = date.min, today
+    else:
+        start, end = today, today + timedelta(days=days)
+
+    return RowsResponse(await list_due_planner_tasks(db, start, end, contact_id, limit))
+
+
+@router.post("/tasks/bulk", response_model=PlannerBulkResponse)
+async def bulk_update_tasks(
+    body: PlannerBulkRequest,
+    db: asyncpg.Connection = Depends(get_db),
+):
+    """
+    Complete and/or reschedule many tasks in one transaction.
+    Body:
+    {
+      "complete": [3, 4],
+      "reschedule": [{"id": 7, "due_date": "2025-01-15"}]
+    }
+    """
+    completed, rescheduled, already_completed = await bulk_update_planner_tasks(
+        db,
+        body.complete,
+        [(item.id, item.due_date) for item in body.reschedule],
+    )
+    found = {row["id"] for row in completed} | {row["id"] for row in rescheduled} | set(already_completed)
+    requested = body.complete + [item.id for item in body.reschedule]
+    not_found = [task_id for task_id in dict.fromkeys(requested) if task_id not in found]
+    return {
+        "completed": completed,
+        "rescheduled": rescheduled,
+        "already_completed": already_completed,
+        "not_found": not_found,
+    }
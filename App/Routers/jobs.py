@@ -1,16 +1,31 @@
 # App/Routers/jobs.py  (or similar)
 
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.concurrency import iterate_in_threadpool
+from fastapi.responses import StreamingResponse
+from typing import List, Literal, Optional
 import asyncpg
 
 from App.db import (
     get_db,
+    pooled_connection,
     list_job_applications,
+    iter_job_applications,
     insert_job_application,
+    import_job_applications,
     update_job_status,
+    bulk_update_job_status,
 )
-from App.schemas import JobApplication, JobApplicationBase
+from App.encoding import RowsResponse, dumps
+from App.pagination import encode_cursor, decode_cursor
+from App.schemas import (
+    JobApplication,
+    JobApplicationBase,
+    BulkJobStatusRequest,
+    BulkJobStatusResponse,
+    JobImportResponse,
+)
+from App.Services.job_import import JobImportReport, detect_format, iter_import_batches
 
 # ⚠️ Adjust this import to match your actual file layout.
 # For example, if your agent lives at:
@@ -24,9 +39,43 @@ gemini = GeminiAgent()
 
 
 @router.get("/", response_model=List[JobApplication])
-async def list_jobs(db: asyncpg.Connection = Depends(get_db)):
-    rows = await list_job_applications(db)
-    return rows
+async def list_jobs(
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: asyncpg.Connection = Depends(get_db),
+):
+    """
+    Newest jobs first, one keyset page at a time.
+    When more rows exist the X-Next-Cursor header carries the cursor
+    for the next page; pass it back as ?cursor=...
+    """
+    before_id = None
+    if cursor:
+        try:
+            before_id = int(decode_cursor(cursor)["before_id"])
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    rows, next_before_id = await list_job_applications(db, limit, before_id)
+    headers = {}
+    if next_before_id is not None:
+        headers["X-Next-Cursor"] = encode_cursor({"before_id": next_before_id})
+    # Rows come straight from typed columns: skip response_model re-validation
+    return RowsResponse(rows, headers=headers)
+
+
+@router.get("/export")
+async def export_jobs():
+    """
+    Every job as newline-delimited JSON, streamed from a server-side
+    cursor instead of being loaded in full.
+    """
+    async def lines():
+        async with pooled_connection() as conn:
+            async for row in iter_job_applications(conn):
+                yield dumps(row) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.post("/", response_model=JobApplication)
@@ -47,6 +96,38 @@ async def create_job(
     return row
 
 
+@router.post("/import", response_model=JobImportResponse)
+async def import_jobs(
+    file: UploadFile = File(...),
+    format: Optional[Literal["csv", "ndjson"]] = Query(
+        None, description="Defaults to the file extension / content type"
+    ),
+    db: asyncpg.Connection = Depends(get_db),
+):
+    """
+    Bulk import from a spreadsheet export (CSV with a header row) or NDJSON.
+    Columns: company, role_title (or job_title), link (or job_link), status,
+    contact_name, contact_linkedin_url, notes. Invalid rows are reported
+    by line and skipped; rows that already exist (same company, role_title
+    and link) are counted as duplicates and not inserted again.
+    """
+    fmt = format or detect_format(file.filename, file.content_type)
+    report = JobImportReport()
+    # Reading, parsing and validating rows is CPU-bound: produce each batch
+    # in the threadpool so the event loop only awaits the COPYs
+    staged, inserted = await import_job_applications(
+        db, iterate_in_threadpool(iter_import_batches(file.file, fmt, report))
+    )
+    return {
+        "received": report.received,
+        "inserted": inserted,
+        "duplicates": staged - inserted,
+        "invalid": report.invalid,
+        "errors": report.errors,
+        "errors_truncated": report.errors_truncated,
+    }
+
+
 @router.post("/{job_id}/status", response_model=JobApplication)
 async def update_job(
     job_id: int,
@@ -75,6 +156,34 @@ async def update_job(
     return row
 
 
+@router.post("/status/bulk", response_model=BulkJobStatusResponse)
+async def update_jobs_bulk(
+    body: BulkJobStatusRequest,
+    db: asyncpg.Connection = Depends(get_db),
+):
+    """
+    Apply many status changes in one statement.
+    Body:
+    {
+      "updates": [
+        {"id": 12, "status": "Interview", "notes_append": "Phone screen booked"},
+        {"id": 15, "status": "Rejected"}
+      ]
+    }
+    Returns the updated rows plus any ids that did not match a job.
+    """
+    rows = await bulk_update_job_status(
+        db,
+        [update.model_dump() for update in body.updates],
+    )
+    found = {row["id"] for row in rows}
+    not_found = []
+    for update in body.updates:
+        if update.id not in found and update.id not in not_found:
+            not_found.append(update.id)
+    return {"updated": rows, "not_found": not_found}
+
+
 @router.post("/parse")
 async def parse(body: dict):
     """
@@ -0,0 +1,324 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..Schemas import RelationshipType
+from .prioritization import RELATIONSHIP_CODES, ContactColumns
+
+_RELATIONSHIPS = {r.value: r for r in RelationshipType}
+
+
+class BulkDecodeError(ValueError):
+    """Raised when a bulk payload is missing or has a malformed scoring field"""
+
+
+class ContactRecord:
+    """
+    Compact stand-in for Contact on bulk endpoints.
+
+    Holds only the fields scoring reads, with the same attribute names,
+    so ContactPrioritization accepts it unchanged. The decoded JSON object
+    is kept as-is and echoed back by dict().
+    """
+
+    __slots__ = (
+        "id",
+        "relationship",
+        "last_interaction_date",
+        "warmth_score",
+        "priority_score",
+        "raw",
+    )
+
+    def __init__(
+        self,
+        id: Optional[int],
+        relationship: Optional[RelationshipType],
+        last_interaction_date: Optional[datetime],
+        warmth_score: float,
+        raw: Dict[str, Any],
+    ):
+        self.id = id
+        self.relationship = relationship
+        self.last_interaction_date = last_interaction_date
+        self.warmth_score = warmth_score
+        self.priority_score = 0.0
+        self.raw = raw
+
+    def dict(self) -> Dict[str, Any]:
+        """Mirror of Contact.dict() for the fields the client sent"""
+        out = dict(self.raw)
+        out["priority_score"] = self.priority_score
+        return out
+
+
+class InteractionRecord:
+    """Compact stand-in for Interaction with only the fields scoring reads"""
+
+    __slots__ = ("contact_id", "date", "type", "sentiment")
+
+    def __init__(self, contact_id: int, date: datetime, type: str, sentiment: str):
+        self.contact_id = contact_id
+        self.date = date
+        self.type = type
+        self.sentiment = sentiment
+
+
+def _int(value, field: str, pos: int) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise BulkDecodeError(f"{field}[{pos}]: expected an integer")
+
+
+def _datetime(value, field: str, pos: int) -> datetime:
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    raise BulkDecodeError(f"{field}[{pos}]: expected an ISO 8601 datetime")
+
+
+def decode_contacts(items: Any) -> List[ContactRecord]:
+    """Decode a JSON array of contact objects, checking only scoring fields"""
+    if not isinstance(items, list):
+        raise BulkDecodeError("contacts: expected a list")
+
+    records = []
+    for pos, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise BulkDecodeError(f"contacts[{pos}]: expected an object")
+
+        contact_id = item.get("id")
+        if contact_id is not None:
+            contact_id = _int(contact_id, "contacts.id", pos)
+
+        relationship = item.get("relationship")
+        if relationship is not None:
+            relationship = _RELATIONSHIPS.get(relationship)
+            if relationship is None:
+                raise BulkDecodeError(f"contacts.relationship[{pos}]: unknown relationship")
+
+        last_interaction = item.get("last_interaction_date")
+        if last_interaction is not None:
+            last_interaction = _datetime(last_interaction, "contacts.last_interaction_date", pos)
+
+        warmth = item.get("warmth_score", 0.0)
+        try:
+            warmth = float(warmth)
+        except (TypeError, ValueError):
+            raise BulkDecodeError(f"contacts.warmth_score[{pos}]: expected a number")
+
+        records.append(ContactRecord(contact_id, relationship, last_interaction, warmth, item))
+
+    return records
+
+
+def decode_interactions(items: Any) -> List[InteractionRecord]:
+    """Decode a JSON array of interaction objects, checking only scoring fields"""
+    if items is None:
+        return []
+    if not isinstance(items, list):
+        raise BulkDecodeError("interactions: expected a list")
+
+    now = datetime.now()
+    records = []
+    for pos, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise BulkDecodeError(f"interactions[{pos}]: expected an object")
+        if "contact_id" not in item:
+            raise BulkDecodeError(f"interactions.contact_id[{pos}]: field required")
+
+        date = item.get("date")
+        records.append(InteractionRecord(
+            _int(item["contact_id"], "interactions.contact_id", pos),
+            _datetime(date, "interactions.date", pos) if date is not None else now,
+            str(item.get("type", "")),
+            str(item.get("sentiment", "neutral")),
+        ))
+
+    return records
+
+
+def _load(body: bytes) -> Dict[str, Any]:
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise BulkDecodeError(f"Invalid JSON: {e}") from e
+    if not isinstance(payload, dict):
+        raise BulkDecodeError("Expected a JSON object")
+    return payload
+
+
+def _optional_int(payload: Dict[str, Any], key: str, minimum: int = 1) -> Optional[int]:
+    value = payload.get(key)
+    if value is None:
+        return None
+    number = _int(value, key, 0)
+    if number < minimum:
+        raise BulkDecodeError(f"{key}: must be at least {minimum}")
+    return number
+
+
+def decode_prioritize_payload(body: bytes) -> Dict[str, Any]:
+    """Fast-path decode of a PrioritizeRequest body"""
+    payload = _load(body)
+    return {
+        "contacts": decode_contacts(payload.get("contacts")),
+        "interactions": decode_interactions(payload.get("interactions")),
+        "limit": _optional_int(payload, "limit"),
+    }
+
+
+def decode_schedule_payload(body: bytes) -> Dict[str, Any]:
+    """Fast-path decode of a ScheduleRequest body"""
+    payload = _load(body)
+    contacts_per_week = _optional_int(payload, "contacts_per_week")
+    weeks = _optional_int(payload, "weeks")
+
+    return {
+        "contacts": decode_contacts(payload.get("contacts")),
+        "interactions": decode_interactions(payload.get("interactions")),
+        "contacts_per_week": 5 if contacts_per_week is None else contacts_per_week,
+        "weeks": weeks,
+        "cursor": payload.get("cursor"),
+    }
+
+
+# -------- Columnar (CSV) uploads --------
+
+
+class ColumnarBatch:
+    """
+    A CSV contact upload decoded column by column.
+
+    `columns` feeds ContactPrioritization.score_columns directly; the raw
+    string columns are only touched again to echo selected rows back.
+    """
+
+    __slots__ = ("columns", "raw", "header")
+
+    def __init__(self, columns: ContactColumns, raw: Dict[str, Tuple[str, ...]], header: List[str]):
+        self.columns = columns
+        self.raw = raw
+        self.header = header
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def row(self, pos: int, priority_score: float) -> Dict[str, Any]:
+        out = {name: self.raw[name][pos] for name in self.header}
+        out["priority_score"] = priority_score
+        return out
+
+
+def _csv_columns(text: str, name: str) -> Tuple[List[str], Dict[str, Tuple[str, ...]]]:
+    """Parse CSV text into (header, {column: values})"""
+    reader = csv.reader(io.StringIO(text))
+    header = [h.strip() for h in next(reader, [])]
+    if not header:
+        raise BulkDecodeError(f"{name}: missing CSV header")
+
+    rows = [row for row in reader if row]
+    for pos, row in enumerate(rows):
+        if len(row) != len(header):
+            raise BulkDecodeError(
+                f"{name}[{pos}]: expected {len(header)} fields, got {len(row)}"
+            )
+
+    if not rows:
+        return header, {h: () for h in header}
+    return header, dict(zip(header, zip(*rows)))
+
+
+def _numeric_column(values, dtype, default: str, field: str) -> np.ndarray:
+    arr = np.array(values, dtype=str)
+    arr[np.char.strip(arr) == ""] = default
+    try:
+        return arr.astype(dtype)
+    except ValueError:
+        raise BulkDecodeError(f"{field}: expected numbers")
+
+
+def _datetime_column(values, field: str) -> np.ndarray:
+    try:
+        return np.array(values, dtype="datetime64[us]")
+    except ValueError:
+        raise BulkDecodeError(f"{field}: expected ISO 8601 datetimes")
+
+
+def _relationship_column(values) -> np.ndarray:
+    arr = np.array(values, dtype=str)
+    uniques, inverse = np.unique(arr, return_inverse=True)
+    codes = []
+    for value in uniques.tolist():
+        value = value.strip()
+        if not value:
+            codes.append(-1)
+        elif value in _RELATIONSHIPS:
+            codes.append(RELATIONSHIP_CODES[_RELATIONSHIPS[value]])
+        else:
+            raise BulkDecodeError(f"contacts.relationship: unknown relationship {value!r}")
+    return np.array(codes, dtype=np.int8)[inverse]
+
+
+def decode_columnar_upload(
+    contacts_csv: str,
+    interactions_csv: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> ColumnarBatch:
+    """
+    Decode CSV contacts (id, relationship, last_interaction_date,
+    warmth_score; other columns are echoed back) and optional CSV
+    interactions (contact_id, date) straight into scoring arrays.
+    """
+    now = now or datetime.now()
+    header, raw = _csv_columns(contacts_csv, "contacts")
+    n = len(next(iter(raw.values()), ()))
+
+    def column(name):
+        return raw.get(name, ("",) * n)
+
+    counts = None
+    if interactions_csv:
+        _, interaction_raw = _csv_columns(interactions_csv, "interactions")
+        if "contact_id" not in interaction_raw:
+            raise BulkDecodeError("interactions: contact_id column required")
+
+        interaction_ids = _numeric_column(
+            interaction_raw["contact_id"], np.int64, "0", "interactions.contact_id"
+        )
+        if len(interaction_ids):
+            # Missing dates default to now, as Interaction.date does
+            now64 = np.datetime64(now, "us")
+            dates = _datetime_column(
+                interaction_raw.get("date", ("",) * len(interaction_ids)),
+                "interactions.date",
+            )
+            dates = np.where(np.isnat(dates), now64, dates)
+
+            # Per-contact count in the last year: sort once, two searchsorted
+            cutoff = np.datetime64(now - timedelta(days=365), "us")
+            recent = np.sort(interaction_ids[dates > cutoff])
+            contact_ids = _numeric_column(column("id"), np.int64, "0", "contacts.id")
+            counts = (
+                np.searchsorted(recent, contact_ids, side="right")
+                - np.searchsorted(recent, contact_ids, side="left")
+            )
+
+    columns = ContactColumns(
+        _datetime_column(column("last_interaction_date"), "contacts.last_interaction_date"),
+        _relationship_column(column("relationship")),
+        _numeric_column(column("warmth_score"), np.float64, "0", "contacts.warmth_score"),
+        counts,
+    )
+    return ColumnarBatch(columns, raw, header)
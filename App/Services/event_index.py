@@ -0,0 +1,377 @@
+import asyncio
+import logging
+import math
+import re
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..Config import settings
+from .eventbrite import EventbriteService, get_eventbrite_service
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are at be by for from in is of on or the to with your you our this that".split()
+)
+
+
+def tokenize(text: Optional[str]) -> Set[str]:
+    """Lower-cased word tokens, minus stopwords and single characters"""
+    if not text:
+        return set()
+    return {t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in _STOPWORDS}
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in kilometres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _parse_start(event: Dict) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(event["start"]).replace(tzinfo=None)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _coordinates(event: Dict) -> Optional[Tuple[float, float]]:
+    # Eventbrite sends venue coordinates as strings
+    venue = event.get("venue") or {}
+    try:
+        return float(venue["latitude"]), float(venue["longitude"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def seed_key(keywords: Optional[str]) -> frozenset:
+    """Normalized form under which a query matches a seed keyword"""
+    return frozenset(tokenize(keywords))
+
+
+class SeedCoverage:
+    """What one seed keyword's searches fetched into the index"""
+
+    __slots__ = ("truncated", "last_start")
+
+    def __init__(self, truncated: bool, last_start: Optional[datetime]):
+        # Some search hit its event cap, failed or ran out of pages
+        self.truncated = truncated
+        # Latest start fetched; the searches are sorted by date, so every
+        # matching event up to here is in the index
+        self.last_start = last_start
+
+    def merge(self, other: "SeedCoverage") -> "SeedCoverage":
+        """Coverage of a keyword searched in several locations: the weakest one"""
+        if self.last_start is None or other.last_start is None:
+            last_start = None
+        else:
+            last_start = min(self.last_start, other.last_start)
+        return SeedCoverage(self.truncated or other.truncated, last_start)
+
+
+class EventIndex:
+    """
+    Parsed Eventbrite events indexed three ways:
+
+    - inverted keyword index over name and description (token -> ids)
+    - ids sorted by start time, for bisect range lookups
+    - a lat/lon grid of `cell_degrees` cells over venue coordinates
+
+    Read-only once built; a refresh builds a new index and swaps it in.
+    Events are shared between requests: treat them as read-only.
+
+    `seeds` (seed_key -> SeedCoverage) and `horizon` describe the searches
+    the events came from, so covers() can tell when a query reaches beyond
+    them. An index built without seeds is a plain filter over its events.
+    """
+
+    def __init__(
+        self,
+        events: Optional[Iterable[Dict]] = None,
+        cell_degrees: float = 0.25,
+        seeds: Optional[Dict[frozenset, SeedCoverage]] = None,
+        horizon: Optional[datetime] = None,
+    ):
+        self.cell_degrees = cell_degrees
+        self.seeds = seeds
+        self.horizon = horizon
+        self.built_at: Optional[datetime] = None
+        self._events: Dict[str, Dict] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._starts: List[datetime] = []
+        self._start_ids: List[str] = []
+        self._start_of: Dict[str, datetime] = {}
+        self._undated: List[str] = []
+        self._coords: Dict[str, Tuple[float, float]] = {}
+        self._grid: Dict[Tuple[int, int], List[str]] = {}
+
+        if events is None:
+            return
+
+        for event in events:
+            event_id = event.get("id")
+            if event_id is None or event_id in self._events:
+                continue
+            self._events[event_id] = event
+
+            for token in tokenize(event.get("name")) | tokenize(event.get("description")):
+                self._postings.setdefault(token, set()).add(event_id)
+
+            start = _parse_start(event)
+            if start is not None:
+                self._start_of[event_id] = start
+            else:
+                self._undated.append(event_id)
+
+            coords = _coordinates(event)
+            if coords is not None:
+                self._coords[event_id] = coords
+                self._grid.setdefault(self._cell(*coords), []).append(event_id)
+
+        by_start = sorted(self._start_of.items(), key=lambda item: item[1])
+        self._start_ids = [event_id for event_id, _ in by_start]
+        self._starts = [start for _, start in by_start]
+        self.built_at = datetime.now()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, event_id) -> bool:
+        return event_id in self._events
+
+    @property
+    def ready(self) -> bool:
+        return self.built_at is not None
+
+    def covers(self, keywords: Optional[str], end: Optional[datetime]) -> bool:
+        """
+        Whether the seed searches span a query: the keywords equal a seed
+        keyword (after normalization), that seed fetched every match it
+        had, and the time window ends by the last start it fetched.
+        Anything else may have matches Eventbrite knows about but the
+        index never fetched, e.g. "development" is not covered by a
+        "professional development" seed.
+        """
+        if not self.ready:
+            return False
+        if self.seeds is None:
+            return self.horizon is None or (end is not None and end <= self.horizon)
+        coverage = self.seeds.get(seed_key(keywords))
+        if coverage is None or coverage.truncated or coverage.last_start is None:
+            return False
+        return end is not None and end <= coverage.last_start
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return int(math.floor(lat / self.cell_degrees)), int(math.floor(lon / self.cell_degrees))
+
+    # -------- Candidate lookups --------
+
+    def _ids_for_keywords(self, keywords: str) -> Optional[Set[str]]:
+        """Ids containing every token (None when there are no tokens)"""
+        tokens = tokenize(keywords)
+        if not tokens:
+            return None
+        postings = sorted((self._postings.get(t, set()) for t in tokens), key=len)
+        ids = set(postings[0])
+        for other in postings[1:]:
+            ids &= other
+            if not ids:
+                break
+        return ids
+
+    def _ids_between(self, start: Optional[datetime], end: Optional[datetime]) -> List[str]:
+        lo = bisect_left(self._starts, start) if start else 0
+        hi = bisect_right(self._starts, end) if end else len(self._starts)
+        return self._start_ids[lo:hi]
+
+    def _ids_near(self, lat: float, lon: float, radius_km: float) -> Dict[str, float]:
+        """id -> distance for events within radius_km, scanning only nearby cells"""
+        lat_span = radius_km / KM_PER_DEGREE
+        cos_lat = math.cos(math.radians(lat))
+        lon_span = 180.0 if cos_lat < 0.01 else min(180.0, radius_km / (KM_PER_DEGREE * cos_lat))
+        lat_lo, lon_lo = self._cell(lat - lat_span, lon - lon_span)
+        lat_hi, lon_hi = self._cell(lat + lat_span, lon + lon_span)
+
+        found = {}
+        if (lat_hi - lat_lo + 1) * (lon_hi - lon_lo + 1) > len(self._grid):
+            cells = [key for key in self._grid if lat_lo <= key[0] <= lat_hi and lon_lo <= key[1] <= lon_hi]
+        else:
+            cells = [(i, j) for i in range(lat_lo, lat_hi + 1) for j in range(lon_lo, lon_hi + 1)]
+        for cell in cells:
+            for event_id in self._grid.get(cell, ()):
+                distance = haversine_km(lat, lon, *self._coords[event_id])
+                if distance <= radius_km:
+                    found[event_id] = distance
+        return found
+
+    # -------- Queries --------
+
+    def search(
+        self,
+        keywords: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+        radius_km: Optional[float] = None,
+    ) -> List[Dict]:
+        """
+        Events matching every given filter, soonest first. Keywords must
+        all appear in the name or description. With lat/lon/radius_km the
+        results are copies carrying a `distance_km` field.
+        """
+        candidates = self._ids_for_keywords(keywords) if keywords else None
+
+        distances = None
+        if lat is not None and lon is not None and radius_km is not None:
+            distances = self._ids_near(lat, lon, radius_km)
+            candidates = set(distances) if candidates is None else candidates & distances.keys()
+
+        if start is None and end is None:
+            if candidates is None:
+                ordered = self._start_ids + self._undated
+            else:
+                # Undated events sort last
+                ordered = sorted(candidates, key=lambda i: self._start_of.get(i, datetime.max))
+        else:
+            window = self._ids_between(start, end)
+            if candidates is None:
+                ordered = window
+            elif len(window) <= len(candidates):
+                ordered = [i for i in window if i in candidates]
+            else:
+                # Fewer candidates than events in the window: check their starts directly
+                lo, hi = start or datetime.min, end or datetime.max
+                ordered = sorted(
+                    (i for i in candidates if lo <= self._start_of.get(i, datetime.max) <= hi and i in self._start_of),
+                    key=self._start_of.__getitem__
+                )
+
+        if distances is None:
+            return [self._events[i] for i in ordered]
+        return [{**self._events[i], "distance_km": round(distances[i], 2)} for i in ordered]
+
+    def stats(self) -> Dict:
+        return {
+            "events": len(self._events),
+            "tokens": len(self._postings),
+            "with_start": len(self._starts),
+            "with_coordinates": len(self._coords),
+            "grid_cells": len(self._grid),
+            "built_at": self.built_at.isoformat() if self.built_at else None,
+        }
+
+
+# -------- Shared index and background refresh --------
+# The app lifespan starts a task that rebuilds the index from Eventbrite
+# every EVENT_INDEX_REFRESH_SECONDS and swaps it in whole, so readers never
+# see a half-built index. Until the first build finishes the index is
+# empty and not `ready`, and the routers fall back to live searches.
+
+_index = EventIndex()
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def get_event_index() -> EventIndex:
+    return _index
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+async def refresh_event_index(service: Optional[EventbriteService] = None) -> EventIndex:
+    """Rebuild the index from the configured keyword/location seed searches"""
+    global _index
+    service = service or get_eventbrite_service()
+    seed_keywords = _split(settings.event_index_keywords)
+    locations = _split(settings.event_index_locations) or [None]
+    queries = [(k, loc) for k in seed_keywords for loc in locations]
+    until = datetime.now() + timedelta(days=settings.event_index_horizon_days)
+    semaphore = asyncio.Semaphore(settings.events_search_concurrency)
+
+    max_events = settings.event_index_max_events_per_query
+
+    async def collect(keywords, location):
+        async with semaphore:
+            return [
+                event async for event in service.iter_events(
+                    keywords=keywords,
+                    location=location,
+                    until=until,
+                    max_events=max_events,
+                    max_pages=max_events,  # never the binding limit
+                    strict=True
+                )
+            ]
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(collect(k, loc) for k, loc in queries), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors and len(errors) == len(results):
+        raise RuntimeError(f"All {len(errors)} event index searches failed: {errors[0]}")
+
+    seeds: Dict[frozenset, SeedCoverage] = {}
+    for (keywords, location), result in zip(queries, results):
+        if isinstance(result, BaseException):
+            logger.warning("Event index search %r @ %r failed: %s", keywords, location, result)
+            coverage = SeedCoverage(truncated=True, last_start=None)
+        else:
+            starts = [s for s in map(_parse_start, result) if s is not None]
+            coverage = SeedCoverage(
+                truncated=len(result) >= max_events,
+                last_start=max(starts) if starts else None
+            )
+        key = seed_key(keywords)
+        seeds[key] = seeds[key].merge(coverage) if key in seeds else coverage
+
+    _index = EventIndex(
+        (event for result in results if not isinstance(result, BaseException) for event in result),
+        cell_degrees=settings.event_index_cell_degrees,
+        seeds=seeds,
+        horizon=until
+    )
+    logger.info("Event index rebuilt: %d events in %.2fs", len(_index), time.perf_counter() - started)
+    return _index
+
+
+async def _refresh_loop() -> None:
+    while True:
+        try:
+            await refresh_event_index()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Keep serving the previous index; live searches cover the gap
+            logger.warning("Event index refresh failed: %s", e)
+        await asyncio.sleep(settings.event_index_refresh_seconds)
+
+
+async def start_event_index_refresh() -> None:
+    """Start the background refresh (idempotent); called from the app lifespan"""
+    global _refresh_task
+    if not settings.event_index_enabled or not settings.has_eventbrite():
+        return
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_event_index_refresh() -> None:
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
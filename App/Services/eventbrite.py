@@ -1,16 +1,122 @@
 cat > app/services/eventbrite.py << 'EOF'
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
+import asyncio
+import logging
 import httpx
-from datetime import datetime
+from datetime import datetime, timedelta
 from ..Config import settings
+from ..cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+try:  # HTTP/2 needs the h2 package (pip install httpx[http2])
+    import h2
+except ImportError:
+    h2 = None
+
+# -------- Shared HTTP client --------
+# One AsyncClient for the whole app, opened and closed by the app lifespan,
+# so Eventbrite calls reuse warm keep-alive connections instead of redoing
+# DNS, TCP and TLS setup on every request.
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+def create_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=h2 is not None,
+        limits=httpx.Limits(
+            max_connections=settings.eventbrite_max_connections,
+            max_keepalive_connections=settings.eventbrite_max_keepalive,
+            keepalive_expiry=30.0
+        ),
+        timeout=httpx.Timeout(settings.eventbrite_timeout_seconds, connect=5.0)
+    )
+
+def get_http_client() -> httpx.AsyncClient:
+    """The shared client, opened lazily for entry points without the lifespan"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+    return _http_client
+
+async def start_http_client() -> httpx.AsyncClient:
+    """Open the shared client (idempotent); called from the app lifespan"""
+    return get_http_client()
+
+async def close_http_client() -> None:
+    """Close the shared client and its pooled connections"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+# -------- Response cache --------
+# Popular searches and event details are served from here; expired entries
+# are served stale while one background request refreshes them, and 404s
+# are remembered briefly so unknown ids do not hit the API repeatedly.
+
+event_cache = ResponseCache(
+    max_entries=settings.eventbrite_cache_max_entries,
+    stale_seconds=settings.eventbrite_stale_seconds,
+    enabled=settings.eventbrite_cache_enabled
+)
+
+DEFAULT_CATEGORIES = ("101", "103")  # 101=Business, 103=Networking
+
+def _floor_hour(value: Optional[datetime]) -> Optional[datetime]:
+    return value.replace(minute=0, second=0, microsecond=0) if value else None
+
+def _ceil_hour(value: Optional[datetime]) -> Optional[datetime]:
+    floored = _floor_hour(value)
+    return floored + timedelta(hours=1) if value and floored != value else floored
+
+def _search_key(keywords, location, categories, start_date, end_date, sort_by, page) -> tuple:
+    """Equivalent searches share a cache entry"""
+    return (
+        "search",
+        " ".join((keywords or "").lower().split()),
+        " ".join((location or "").lower().split()),
+        tuple(sorted({str(c).strip() for c in categories})) if categories else DEFAULT_CATEGORIES,
+        start_date.isoformat() if start_date else None,
+        end_date.isoformat() if end_date else None,
+        sort_by,
+        page
+    )
+
+def _search_ttl(result: Dict) -> Optional[float]:
+    return None if "error" in result else settings.eventbrite_search_ttl_seconds
+
+def _details_ttl(result: Dict) -> Optional[float]:
+    if "error" not in result:
+        return settings.eventbrite_details_ttl_seconds
+    if result.get("status_code") == 404:
+        return settings.eventbrite_not_found_ttl_seconds
+    return None  # transient errors are retried on the next request
 
 class EventbriteService:
     """Eventbrite API integration for networking events"""
     
     BASE_URL = "https://www.eventbriteapi.com/v3"
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Per-call timeouts, scaled from EVENTBRITE_TIMEOUT_SECONDS (10s gives
+    # 15s / 10s / 20s); searches and attendee lists are the slow endpoints
+    SEARCH_TIMEOUT = httpx.Timeout(settings.eventbrite_timeout_seconds * 1.5, connect=5.0)
+    DETAILS_TIMEOUT = httpx.Timeout(settings.eventbrite_timeout_seconds, connect=5.0)
+    ATTENDEES_TIMEOUT = httpx.Timeout(settings.eventbrite_timeout_seconds * 2, connect=5.0)
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        cache: Optional[ResponseCache] = None
+    ):
         self.api_key = api_key or settings.eventbrite_api_key
+        self._client = client
+        self.cache = cache if cache is not None else event_cache
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or get_http_client()
     
     def _get_headers(self) -> Dict:
         if not self.api_key:
@@ -24,10 +130,98 @@ class EventbriteService:
         location: Optional[str] = None,
         categories: List[str] = None,
         start_date: Optional[datetime] = None,
-        page: int = 1
+        page: int = 1,
+        end_date: Optional[datetime] = None,
+        sort_by: Optional[str] = None
     ) -> Dict:
-        """Search for networking events"""
+        """Search for networking events (cached)"""
+        
+        # Whole-hour date bounds, so "now + N days" callers share cache entries
+        # (and Eventbrite gets plain timestamps); the range only ever widens
+        start_date = _floor_hour(start_date)
+        end_date = _ceil_hour(end_date)
         
+        key = _search_key(keywords, location, categories, start_date, end_date, sort_by, page)
+        return await self.cache.get_or_load(
+            key,
+            lambda: self._fetch_search(keywords, location, categories, start_date, end_date, sort_by, page),
+            _search_ttl
+        )
+    
+    async def iter_events(
+        self,
+        keywords: str = "networking",
+        location: Optional[str] = None,
+        categories: List[str] = None,
+        start_date: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        max_events: Optional[int] = None,
+        max_pages: int = 10,
+        strict: bool = False
+    ) -> AsyncIterator[Dict]:
+        """Stream parsed events across result pages, in start order
+        
+        The next page is requested as soon as the current one arrives, so
+        it downloads while the caller consumes this one. Stops after
+        max_events events, at the first event starting after `until`, or
+        after max_pages pages. Raises RuntimeError if the first page fails;
+        a failure on a later page just ends the stream, unless `strict`, in
+        which case that and running out of pages also raise, so a stream
+        that ends normally is known to be complete up to its limits.
+        """
+        horizon = until.replace(tzinfo=None).isoformat() if until else None
+        
+        def fetch(page: int) -> asyncio.Task:
+            return asyncio.create_task(self.search_events(
+                keywords=keywords,
+                location=location,
+                categories=categories,
+                start_date=start_date,
+                end_date=until,
+                sort_by="date",
+                page=page
+            ))
+        
+        page = 1
+        next_page = fetch(page)
+        yielded = 0
+        try:
+            while next_page is not None:
+                results = await next_page
+                next_page = None
+                if "error" in results:
+                    if page == 1 or strict:
+                        raise RuntimeError(results["error"])
+                    logger.warning("Eventbrite search stopped at page %d: %s", page, results["error"])
+                    return
+                
+                if results.get("has_more") and page < max_pages:
+                    next_page = fetch(page + 1)
+                
+                for event in results.get("events", []):
+                    if horizon and (event.get("start") or "") > horizon:
+                        return
+                    yield event
+                    yielded += 1
+                    if max_events is not None and yielded >= max_events:
+                        return
+                if next_page is None and results.get("has_more") and strict:
+                    raise RuntimeError(f"Eventbrite search has more than {max_pages} pages")
+                page += 1
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+    
+    async def _fetch_search(
+        self,
+        keywords: str,
+        location: Optional[str],
+        categories: Optional[List[str]],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        sort_by: Optional[str],
+        page: int
+    ) -> Dict:
         params = {
             "q": keywords,
             "page": page,
@@ -37,67 +231,75 @@ class EventbriteService:
         if location:
             params["location.address"] = location
         
-        # Eventbrite categories: 101=Business, 103=Networking
-        if categories:
-            params["categories"] = ",".join(categories)
-        else:
-            params["categories"] = "101,103"
+        params["categories"] = ",".join(categories or DEFAULT_CATEGORIES)
         
         if start_date:
             params["start_date.range_start"] = start_date.isoformat()
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/events/search/",
-                headers=self._get_headers(),
-                params=params,
-                timeout=10.0
-            )
-            
-            if response.status_code != 200:
-                return {
-                    "error": f"Eventbrite API error: {response.status_code}",
-                    "events": []
-                }
-            
-            data = response.json()
-            
+        if end_date:
+            params["start_date.range_end"] = end_date.isoformat()
+        
+        if sort_by:
+            params["sort_by"] = sort_by
+        
+        response = await self.client.get(
+            f"{self.BASE_URL}/events/search/",
+            headers=self._get_headers(),
+            params=params,
+            timeout=self.SEARCH_TIMEOUT
+        )
+        
+        if response.status_code != 200:
             return {
-                "total": data.get("pagination", {}).get("object_count", 0),
-                "events": [self._parse_event(e) for e in data.get("events", [])]
+                "error": f"Eventbrite API error: {response.status_code}",
+                "events": []
             }
+        
+        data = response.json()
+        pagination = data.get("pagination", {})
+        
+        return {
+            "total": pagination.get("object_count", 0),
+            "has_more": pagination.get("has_more_items", False),
+            "events": [self._parse_event(e) for e in data.get("events", [])]
+        }
     
     async def get_event_details(self, event_id: str) -> Dict:
-        """Get detailed information about a specific event"""
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/events/{event_id}/",
-                headers=self._get_headers(),
-                params={"expand": "venue,organizer,ticket_classes"},
-                timeout=10.0
-            )
-            
-            if response.status_code != 200:
-                return {"error": f"Event not found: {event_id}"}
-            
-            return self._parse_event(response.json())
+        """Get detailed information about a specific event (cached)"""
+        
+        return await self.cache.get_or_load(
+            ("event", event_id),
+            lambda: self._fetch_event_details(event_id),
+            _details_ttl
+        )
+    
+    async def _fetch_event_details(self, event_id: str) -> Dict:
+        response = await self.client.get(
+            f"{self.BASE_URL}/events/{event_id}/",
+            headers=self._get_headers(),
+            params={"expand": "venue,organizer,ticket_classes"},
+            timeout=self.DETAILS_TIMEOUT
+        )
+        
+        if response.status_code != 200:
+            return {"error": f"Event not found: {event_id}", "status_code": response.status_code}
+        
+        return self._parse_event(response.json())
     
     async def get_event_attendees(self, event_id: str) -> List[Dict]:
         """Get attendees for an event (requires organizer access)"""
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/events/{event_id}/attendees/",
-                headers=self._get_headers(),
-                timeout=10.0
-            )
-            
-            if response.status_code != 200:
-                return []
-            
-            data = response.json()
-            return data.get("attendees", [])
+        response = await self.client.get(
+            f"{self.BASE_URL}/events/{event_id}/attendees/",
+            headers=self._get_headers(),
+            timeout=self.ATTENDEES_TIMEOUT
+        )
+        
+        if response.status_code != 200:
+            return []
+        
+        data = response.json()
+        return data.get("attendees", [])
     
     def _parse_event(self, event_data: Dict) -> Dict:
         """Parse Eventbrite event data into simplified format"""
@@ -128,4 +330,13 @@ class EventbriteService:
             "is_free": event_data.get("is_free", False),
             "logo_url": event_data.get("logo", {}).get("url")
         }
+
+_service: Optional[EventbriteService] = None
+
+def get_eventbrite_service() -> EventbriteService:
+    """FastAPI dependency: one EventbriteService shared by all requests"""
+    global _service
+    if _service is None:
+        _service = EventbriteService()
+    return _service
 EOF
@@ -0,0 +1,99 @@
+from bisect import bisect_right
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from ..Schemas import Interaction
+
+
+class InteractionIndex:
+    """
+    Interactions grouped by contact_id, each group kept sorted by date.
+
+    Built once per request and shared by every scorer, so per-contact
+    lookups cost O(log n) instead of a scan over all interactions.
+    """
+
+    def __init__(self, interactions: Optional[Iterable[Interaction]] = None):
+        self._groups: Dict[object, List[Interaction]] = {}
+        self._dates: Dict[object, List[datetime]] = {}
+        self._size = 0
+
+        if interactions:
+            for interaction in interactions:
+                self._groups.setdefault(interaction.contact_id, []).append(interaction)
+                self._size += 1
+
+            for contact_id, group in self._groups.items():
+                group.sort(key=lambda i: i.date)
+                self._dates[contact_id] = [i.date for i in group]
+
+    @classmethod
+    def coerce(cls, interactions) -> "InteractionIndex":
+        """Return `interactions` if it is already an index, else index it"""
+        if isinstance(interactions, cls):
+            return interactions
+        return cls(interactions)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, contact_id) -> bool:
+        return contact_id in self._groups
+
+    def contact_ids(self) -> List:
+        return list(self._groups)
+
+    def add(self, interaction: Interaction) -> None:
+        """Insert one interaction, keeping its group sorted"""
+        contact_id = interaction.contact_id
+        dates = self._dates.setdefault(contact_id, [])
+        group = self._groups.setdefault(contact_id, [])
+
+        pos = bisect_right(dates, interaction.date)
+        dates.insert(pos, interaction.date)
+        group.insert(pos, interaction)
+        self._size += 1
+
+    def count_since(self, contact_id, since: datetime) -> int:
+        """Number of interactions for a contact strictly after `since`"""
+        dates = self._dates.get(contact_id)
+        if not dates:
+            return 0
+        return len(dates) - bisect_right(dates, since)
+
+    def counts_since(self, since: datetime) -> Dict:
+        """count_since for every indexed contact"""
+        return {
+            contact_id: len(dates) - bisect_right(dates, since)
+            for contact_id, dates in self._dates.items()
+        }
+
+    def recent(
+        self,
+        contact_id,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Interaction]:
+        """Most recent interactions first, optionally only those after `since`"""
+        group = self._groups.get(contact_id)
+        if not group:
+            return []
+
+        start = bisect_right(self._dates[contact_id], since) if since else 0
+        stop = start
+        if limit is not None:
+            stop = max(start, len(group) - limit)
+
+        return group[stop:][::-1]
+
+    def oldest_since(self, contact_id, since: datetime) -> Optional[datetime]:
+        """Date of the earliest interaction strictly after `since`"""
+        dates = self._dates.get(contact_id)
+        if not dates:
+            return None
+        pos = bisect_right(dates, since)
+        return dates[pos] if pos < len(dates) else None
+
+    def last_date(self, contact_id) -> Optional[datetime]:
+        dates = self._dates.get(contact_id)
+        return dates[-1] if dates else None
@@ -0,0 +1,127 @@
+import csv
+import io
+import json
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from ..Schemas import JobImportRow
+
+IMPORT_COLUMNS = (
+    "company",
+    "role_title",
+    "link",
+    "status",
+    "contact_name",
+    "contact_linkedin_url",
+    "notes",
+)
+
+
+class JobImportReport:
+    """
+    Running tally of an import: rows seen, rows rejected and the first
+    `max_errors` per-row errors (line numbers are 1-based, header = line 1
+    for CSV).
+    """
+
+    def __init__(self, max_errors: int = 1000):
+        self.max_errors = max_errors
+        self.received = 0
+        self.invalid = 0
+        self.errors: List[Dict[str, Any]] = []
+
+    @property
+    def errors_truncated(self) -> bool:
+        return self.invalid > len(self.errors)
+
+    def reject(self, line: int, error: str) -> None:
+        self.invalid += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "error": error})
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str]) -> str:
+    """'csv' or 'ndjson' from the upload's filename / content type"""
+    name = (filename or "").lower()
+    ctype = (content_type or "").lower()
+    if name.endswith((".ndjson", ".jsonl")) or "ndjson" in ctype or "jsonl" in ctype:
+        return "ndjson"
+    return "csv"
+
+
+def _csv_rows(text: io.TextIOBase) -> Iterator[Tuple[int, Any]]:
+    reader = csv.DictReader(text)
+    for row in reader:
+        # line_num counts physical lines, so quoted newlines keep numbers right
+        if None in row:
+            yield reader.line_num, "too many fields"
+        else:
+            yield reader.line_num, row
+
+
+def _ndjson_rows(text: io.TextIOBase) -> Iterator[Tuple[int, Any]]:
+    for line_no, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_no, f"invalid JSON: {e}"
+            continue
+        yield line_no, row if isinstance(row, dict) else "expected a JSON object"
+
+
+def _validation_message(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}"
+        for err in e.errors()
+    )
+
+
+def iter_import_batches(
+    file: BinaryIO,
+    fmt: str,
+    report: JobImportReport,
+    batch_size: int = 1000,
+) -> Iterator[List[Tuple]]:
+    """
+    Read an upload line by line and yield batches of valid records
+    (line, *IMPORT_COLUMNS) ready for COPY. Invalid rows are recorded on
+    `report` and skipped, so one bad row never fails the whole import.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", errors="replace", newline="")
+    rows = _ndjson_rows(text) if fmt == "ndjson" else _csv_rows(text)
+
+    batch: List[Tuple] = []
+    try:
+        for line_no, row in rows:
+            report.received += 1
+            if isinstance(row, str):
+                report.reject(line_no, row)
+                continue
+
+            # Blank cells mean "not given" so defaults apply
+            values = {
+                key.strip(): value.strip() if isinstance(value, str) else value
+                for key, value in row.items()
+                if key and value not in ("", None)
+            }
+            try:
+                job = JobImportRow.model_validate(values)
+            except ValidationError as e:
+                report.reject(line_no, _validation_message(e))
+                continue
+
+            batch.append((line_no, *(getattr(job, c) for c in IMPORT_COLUMNS)))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    except (csv.Error, UnicodeDecodeError) as e:
+        report.reject(report.received + 1, f"unreadable input: {e}")
+
+    if batch:
+        yield batch
+
+    # Leave the upload open for the caller
+    text.detach()
@@ -1,7 +1,95 @@
 cat > app/services/prioritization.py << 'EOF'
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Tuple
+from itertools import islice
+from bisect import bisect_right
+import heapq
 from datetime import datetime, timedelta
+import numpy as np
 from ..Schemas import Contact, Interaction, RelationshipType
+from .interaction_index import InteractionIndex
+
+# Stable integer code per relationship, used by the columnar scorer.
+# -1 means "no relationship set".
+RELATIONSHIP_CODES = {rel: code for code, rel in enumerate(RelationshipType)}
+
+
+def top_k_indices(scores: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of the k highest scores, highest first, ties in input order.
+
+    Same order as a stable sort on -score, but O(n + k log k) via partition.
+    k=None ranks every score; k must otherwise be at least 1.
+    """
+    if k is not None and k < 1:
+        raise ValueError(f"k must be >= 1, got {k}")
+    n = len(scores)
+    if k is None or k >= n:
+        return np.argsort(-scores, kind="stable")
+
+    kth = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:k - len(above)]
+    candidates = np.concatenate([above, ties])
+
+    # lexsort: last key is primary
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+class ContactColumns:
+    """Columnar (NumPy) view of a batch of contacts, holding only what scoring needs"""
+
+    __slots__ = ("last_interaction", "relationship", "warmth", "interaction_count")
+
+    def __init__(
+        self,
+        last_interaction: np.ndarray,
+        relationship: np.ndarray,
+        warmth: np.ndarray,
+        interaction_count: Optional[np.ndarray] = None
+    ):
+        self.last_interaction = last_interaction  # datetime64[us], NaT = never contacted
+        self.relationship = relationship  # int8 RELATIONSHIP_CODES, -1 = unknown
+        self.warmth = warmth  # float64 stored warmth_score
+        # int64 interactions in the last year, or None when no interactions were supplied
+        self.interaction_count = interaction_count
+
+    def __len__(self) -> int:
+        return len(self.warmth)
+
+    @classmethod
+    def from_contacts(
+        cls,
+        contacts: List[Contact],
+        interaction_counts: Optional[Dict] = None
+    ) -> "ContactColumns":
+        """Build columns from contact models (one pass per column)"""
+
+        n = len(contacts)
+        last_interaction = np.array(
+            [c.last_interaction_date for c in contacts],
+            dtype="datetime64[us]"
+        )
+        relationship = np.fromiter(
+            (RELATIONSHIP_CODES.get(c.relationship, -1) for c in contacts),
+            dtype=np.int8,
+            count=n
+        )
+        warmth = np.fromiter(
+            (c.warmth_score for c in contacts),
+            dtype=np.float64,
+            count=n
+        )
+
+        counts = None
+        if interaction_counts is not None:
+            counts = np.fromiter(
+                (interaction_counts.get(c.id or 0, 0) for c in contacts),
+                dtype=np.int64,
+                count=n
+            )
+
+        return cls(last_interaction, relationship, warmth, counts)
+
 
 class ContactPrioritization:
     """Advanced contact prioritization algorithm"""
@@ -17,17 +105,29 @@ class ContactPrioritization:
         RelationshipType.NEVER_MET: 2
     }
     
+    # Recency points by days since last interaction: <30, <60, <90, <180, older
+    RECENCY_THRESHOLDS = (30, 60, 90, 180)
+    RECENCY_POINTS = (5.0, 15.0, 25.0, 35.0, 40.0)
+    
+    # Frequency points by interactions in the last year: 0, <3, <6, <12, more
+    FREQUENCY_THRESHOLDS = (1, 3, 6, 12)
+    FREQUENCY_POINTS = (20.0, 15.0, 10.0, 5.0, 2.0)
+    
+    # Batches at least this large are scored with the columnar engine
+    VECTORIZE_MIN_BATCH = 512
+    
     def calculate_priority_score(
         self, 
         contact: Contact, 
-        interactions: List[Interaction] = None
+        interactions: List[Interaction] = None,
+        now: Optional[datetime] = None
     ) -> float:
         """Calculate comprehensive priority score (0-100)"""
         
         score = 0.0
         
         # 1. Recency Score (40 points max)
-        score += self._calculate_recency_score(contact)
+        score += self._calculate_recency_score(contact, now)
         
         # 2. Relationship Strength (25 points max)
         if contact.relationship:
@@ -37,7 +137,7 @@ class ContactPrioritization:
         
         # 3. Interaction Frequency (20 points max)
         if interactions:
-            score += self._calculate_frequency_score(contact, interactions)
+            score += self._calculate_frequency_score(contact, interactions, now)
         
         # 4. Warmth/Quality Score (15 points max)
         # Use existing warmth_score if available
@@ -46,77 +146,172 @@ class ContactPrioritization:
         
         return min(100.0, score)
     
-    def _calculate_recency_score(self, contact: Contact) -> float:
+    def _calculate_recency_score(
+        self,
+        contact: Contact,
+        now: Optional[datetime] = None
+    ) -> float:
         """Score based on time since last interaction"""
         
         if not contact.last_interaction_date:
             return 40.0  # Never contacted = highest priority
         
-        days_since = (datetime.now() - contact.last_interaction_date).days
+        days_since = ((now or datetime.now()) - contact.last_interaction_date).days
         
-        if days_since < 30:
-            return 5.0
-        elif days_since < 60:
-            return 15.0
-        elif days_since < 90:
-            return 25.0
-        elif days_since < 180:
-            return 35.0
-        else:
-            return 40.0
+        return self.RECENCY_POINTS[bisect_right(self.RECENCY_THRESHOLDS, days_since)]
     
     def _calculate_frequency_score(
         self, 
         contact: Contact, 
-        interactions: List[Interaction]
+        interactions: List[Interaction],
+        now: Optional[datetime] = None
     ) -> float:
         """Score based on interaction frequency"""
         
-        one_year_ago = datetime.now() - timedelta(days=365)
-        recent_interactions = [
-            i for i in interactions 
-            if i.contact_id == (contact.id or 0) and i.date > one_year_ago
-        ]
+        one_year_ago = (now or datetime.now()) - timedelta(days=365)
+        index = InteractionIndex.coerce(interactions)
+        count = index.count_since(contact.id or 0, one_year_ago)
         
-        count = len(recent_interactions)
+        return self.FREQUENCY_POINTS[bisect_right(self.FREQUENCY_THRESHOLDS, count)]
+    
+    def next_score_change(
+        self,
+        contact: Contact,
+        interactions: InteractionIndex = None,
+        now: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        """
+        Earliest time after `now` at which the score changes on its own:
+        a recency threshold is crossed or an interaction leaves the
+        one-year frequency window. None if the score is stable.
+        """
         
-        if count == 0:
-            return 20.0
-        elif count < 3:
-            return 15.0
-        elif count < 6:
-            return 10.0
-        elif count < 12:
-            return 5.0
-        else:
-            return 2.0
+        now = now or datetime.now()
+        candidates = []
+        
+        if contact.last_interaction_date:
+            days_since = (now - contact.last_interaction_date).days
+            pos = bisect_right(self.RECENCY_THRESHOLDS, days_since)
+            if pos < len(self.RECENCY_THRESHOLDS):
+                candidates.append(
+                    contact.last_interaction_date
+                    + timedelta(days=self.RECENCY_THRESHOLDS[pos])
+                )
+        
+        if interactions:
+            oldest = interactions.oldest_since(
+                contact.id or 0,
+                now - timedelta(days=365)
+            )
+            if oldest:
+                candidates.append(oldest + timedelta(days=365))
+        
+        return min(candidates) if candidates else None
+    
+    def score_columns(
+        self,
+        columns: ContactColumns,
+        now: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Vectorized calculate_priority_score over a whole batch"""
+        
+        now = now or datetime.now()
+        
+        # 1. Recency Score (40 points max)
+        now64 = np.datetime64(now, "us")
+        never_contacted = np.isnat(columns.last_interaction)
+        last_interaction = np.where(never_contacted, now64, columns.last_interaction)
+        days_since = (now64 - last_interaction) // np.timedelta64(1, "D")
+        recency_points = np.array(self.RECENCY_POINTS)
+        score = np.where(
+            never_contacted,
+            40.0,
+            recency_points[np.searchsorted(self.RECENCY_THRESHOLDS, days_since, side="right")]
+        )
+        
+        # 2. Relationship Strength (25 points max); code -1 hits the trailing default
+        weights = np.array(
+            [self.RELATIONSHIP_WEIGHTS.get(rel, 10) for rel in RELATIONSHIP_CODES] + [10],
+            dtype=np.float64
+        )
+        score = score + weights[columns.relationship]
+        
+        # 3. Interaction Frequency (20 points max)
+        if columns.interaction_count is not None:
+            frequency_points = np.array(self.FREQUENCY_POINTS)
+            score = score + frequency_points[
+                np.searchsorted(self.FREQUENCY_THRESHOLDS, columns.interaction_count, side="right")
+            ]
+        
+        # 4. Warmth/Quality Score (15 points max)
+        warmth = np.where(columns.warmth != 0, columns.warmth, 50.0)
+        score = score + (warmth / 100) * 15
+        
+        # fmin keeps min(100.0, nan) == 100.0 semantics
+        return np.fmin(100.0, score)
+    
+    def score_batch(
+        self,
+        contacts: List[Contact],
+        interactions: List[Interaction] = None,
+        now: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Score a batch of contacts with the columnar engine"""
+        
+        now = now or datetime.now()
+        
+        counts = None
+        if interactions:
+            index = InteractionIndex.coerce(interactions)
+            counts = index.counts_since(now - timedelta(days=365))
+        
+        columns = ContactColumns.from_contacts(contacts, counts)
+        return self.score_columns(columns, now)
     
     def prioritize_contacts(
         self, 
         contacts: List[Contact], 
         interactions: List[Interaction] = None,
-        limit: int = None
+        limit: int = None,
+        vectorized: Optional[bool] = None
     ) -> List[Contact]:
-        """Sort contacts by priority score"""
+        """Sort contacts by priority score
+        
+        vectorized=None picks the columnar engine for batches of at least
+        VECTORIZE_MIN_BATCH contacts; both engines produce identical scores.
+        """
+        
+        if vectorized is None:
+            vectorized = len(contacts) >= self.VECTORIZE_MIN_BATCH
+        
+        # One index per request, shared by every contact
+        if interactions:
+            interactions = InteractionIndex.coerce(interactions)
+        
+        # Calculate scores, then rank (highest first). With a limit only
+        # the top `limit` contacts are ordered: O(n log k) instead of a full sort.
+        if vectorized:
+            scores = self.score_batch(contacts, interactions)
+            for contact, score in zip(contacts, scores.tolist()):
+                contact.priority_score = score
+            
+            return [contacts[i] for i in top_k_indices(scores, limit).tolist()]
         
-        # Calculate scores
         for contact in contacts:
             contact.priority_score = self.calculate_priority_score(
                 contact, 
                 interactions
             )
         
-        # Sort by priority (highest first)
-        sorted_contacts = sorted(
+        if limit:
+            # nlargest is documented equivalent to sorted(..., reverse=True)[:limit]
+            return heapq.nlargest(limit, contacts, key=lambda c: c.priority_score)
+        
+        return sorted(
             contacts, 
             key=lambda c: c.priority_score, 
             reverse=True
         )
-        
-        if limit:
-            return sorted_contacts[:limit]
-        
-        return sorted_contacts
     
     def generate_outreach_schedule(
         self, 
@@ -126,38 +321,78 @@ class ContactPrioritization:
     ) -> Dict[str, List[Contact]]:
         """Generate weekly outreach schedule"""
         
+        if interactions:
+            interactions = InteractionIndex.coerce(interactions)
+        
         prioritized = self.prioritize_contacts(contacts, interactions)
         
         schedule = {}
-        current_date = datetime.now()
-        
-        for i, contact in enumerate(prioritized):
-            week_num = i // contacts_per_week
-            week_start = current_date + timedelta(weeks=week_num)
-            week_key = week_start.strftime("%Y-W%W")
-            
-            if week_key not in schedule:
-                schedule[week_key] = []
-            
-            schedule[week_key].append(contact)
+        for week_key, week_contacts in self.iter_outreach_weeks(
+            prioritized,
+            contacts_per_week
+        ):
+            schedule.setdefault(week_key, []).extend(week_contacts)
         
         return schedule
     
+    def iter_outreach_weeks(
+        self,
+        prioritized: List[Contact],
+        contacts_per_week: int = 5,
+        start: Optional[datetime] = None,
+        first_week: int = 0
+    ) -> Iterator[Tuple[str, List[Contact]]]:
+        """Lazily yield (week_key, contacts) buckets of an already ranked list"""
+        
+        start = start or datetime.now()
+        week_num = first_week
+        
+        for offset in range(first_week * contacts_per_week, len(prioritized), contacts_per_week):
+            # One strftime per week, not per contact
+            week_key = (start + timedelta(weeks=week_num)).strftime("%Y-W%W")
+            yield week_key, prioritized[offset:offset + contacts_per_week]
+            week_num += 1
+    
+    def outreach_schedule_page(
+        self,
+        contacts: List[Contact],
+        interactions: List[Interaction] = None,
+        contacts_per_week: int = 5,
+        weeks: int = 4,
+        first_week: int = 0,
+        start: Optional[datetime] = None
+    ) -> Tuple[List[Tuple[str, List[Contact]]], bool]:
+        """
+        Weeks [first_week, first_week + weeks) of the outreach schedule.
+        
+        Only the contacts those weeks need are ranked (top-k), so a page
+        costs O(n log k) regardless of how long the full schedule is.
+        Returns the week buckets and whether more weeks follow.
+        """
+        
+        needed = (first_week + weeks) * contacts_per_week
+        prioritized = self.prioritize_contacts(contacts, interactions, needed)
+        
+        page = list(islice(
+            self.iter_outreach_weeks(prioritized, contacts_per_week, start, first_week),
+            weeks
+        ))
+        
+        return page, len(contacts) > needed
+    
     def calculate_warmth_score(
         self, 
         contact: Contact, 
         interactions: List[Interaction]
     ) -> float:
-        """Calculate relationship warmth based on interaction quality"""
+        """Calculate relationship warmth from the 10 most recent interactions"""
         
         if not interactions:
             return contact.warmth_score if contact.warmth_score else 50.0
         
         six_months_ago = datetime.now() - timedelta(days=180)
-        recent = [
-            i for i in interactions 
-            if i.contact_id == (contact.id or 0) and i.date > six_months_ago
-        ]
+        index = InteractionIndex.coerce(interactions)
+        recent = index.recent(contact.id or 0, since=six_months_ago, limit=10)
         
         if not recent:
             return 40.0
@@ -178,9 +413,34 @@ class ContactPrioritization:
         
         total_score = 50.0
         
-        for interaction in recent[:10]:
+        for interaction in recent:
             total_score += sentiment_scores.get(interaction.sentiment, 0)
             total_score += type_scores.get(interaction.type, 5)
         
         return max(0.0, min(100.0, total_score))
+    
+    def calculate_warmth_scores(
+        self,
+        contacts: List[Contact],
+        interactions: List[Interaction] = None
+    ) -> List[float]:
+        """calculate_warmth_score for many contacts over one shared index"""
+        
+        if interactions:
+            interactions = InteractionIndex.coerce(interactions)
+        
+        return [
+            self.calculate_warmth_score(contact, interactions)
+            for contact in contacts
+        ]
+    
+    @staticmethod
+    def warmth_bucket(warmth: float) -> str:
+        """Map a warmth score to its hot/warm/cold bucket"""
+        
+        if warmth >= 70:
+            return "hot"
+        elif warmth >= 40:
+            return "warm"
+        return "cold"
 EOF
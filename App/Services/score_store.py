@@ -0,0 +1,219 @@
+import asyncio
+import heapq
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..Schemas import Contact, Interaction
+from .interaction_index import InteractionIndex
+from .prioritization import ContactPrioritization
+
+
+class PriorityScoreStore:
+    """
+    Long-lived priority scores with change-driven recompute.
+
+    Scores are only recalculated for contacts that are dirty: edited,
+    given a new interaction, or due because a recency threshold or the
+    one-year frequency window was crossed. A time-ordered queue holds the
+    next such boundary per contact, and the ranking is kept sorted so
+    reading the top contacts is a slice rather than a full recompute.
+
+    The store itself is in-memory. `version` is the persisted change
+    version it reflects; see ScoreStoreRegistry.
+    """
+
+    def __init__(self, prioritizer: Optional[ContactPrioritization] = None):
+        self.prioritizer = prioritizer or ContactPrioritization()
+        self.version = 0
+        self._contacts: Dict[object, Contact] = {}
+        self._interactions = InteractionIndex()
+        self._scores: Dict[object, float] = {}
+        self._dirty: Set = set()
+
+        # Ranking entries are (-score, seq, contact_id); seq keeps ties in
+        # first-seen order, like the stable sort in prioritize_contacts.
+        self._ranking: List[Tuple[float, int, object]] = []
+        self._seq: Dict[object, int] = {}
+        self._next_seq = 0
+
+        # Min-heap of (due_at, seq, contact_id); stale entries are skipped
+        # by comparing against _due_at.
+        self._due: List[Tuple[datetime, int, object]] = []
+        self._due_at: Dict[object, datetime] = {}
+
+    def __len__(self) -> int:
+        return len(self._contacts)
+
+    def __contains__(self, contact_id) -> bool:
+        return contact_id in self._contacts
+
+    @property
+    def dirty_count(self) -> int:
+        return len(self._dirty)
+
+    # -------- Writes --------
+
+    def upsert_contact(self, contact: Contact) -> None:
+        """Add or replace a contact and mark it for recompute"""
+        if contact.id is None:
+            raise ValueError("Contacts in the score store need an id")
+
+        if contact.id not in self._seq:
+            self._seq[contact.id] = self._next_seq
+            self._next_seq += 1
+
+        self._contacts[contact.id] = contact
+        self._dirty.add(contact.id)
+
+    def upsert_contacts(self, contacts: Iterable[Contact]) -> None:
+        for contact in contacts:
+            self.upsert_contact(contact)
+
+    def remove_contact(self, contact_id) -> None:
+        if self._contacts.pop(contact_id, None) is None:
+            return
+        self._unrank(contact_id)
+        self._scores.pop(contact_id, None)
+        self._due_at.pop(contact_id, None)
+        self._seq.pop(contact_id, None)
+        self._dirty.discard(contact_id)
+
+    def log_interaction(self, interaction: Interaction) -> None:
+        """Record an interaction and mark its contact for recompute"""
+        if not self._interactions:
+            # The frequency component only applies once any interaction
+            # is known, so the first one changes every score.
+            self._dirty.update(self._contacts)
+
+        self._interactions.add(interaction)
+        if interaction.contact_id in self._contacts:
+            self._dirty.add(interaction.contact_id)
+
+    def log_interactions(self, interactions: Iterable[Interaction]) -> None:
+        for interaction in interactions:
+            self.log_interaction(interaction)
+
+    # -------- Recompute --------
+
+    def refresh(self, now: Optional[datetime] = None) -> int:
+        """
+        Re-score dirty contacts and those whose next boundary has passed.
+        Returns the number of contacts recomputed.
+        """
+        now = now or datetime.now()
+
+        while self._due and self._due[0][0] <= now:
+            due_at, _, contact_id = heapq.heappop(self._due)
+            if self._due_at.get(contact_id) == due_at:
+                del self._due_at[contact_id]
+                self._dirty.add(contact_id)
+
+        dirty, self._dirty = self._dirty, set()
+        for contact_id in dirty:
+            contact = self._contacts.get(contact_id)
+            if contact is not None:
+                self._rescore(contact, now)
+
+        return len(dirty)
+
+    def _rescore(self, contact: Contact, now: datetime) -> None:
+        score = self.prioritizer.calculate_priority_score(
+            contact,
+            self._interactions,
+            now
+        )
+        contact.priority_score = score
+
+        if self._scores.get(contact.id) != score:
+            self._unrank(contact.id)
+            self._scores[contact.id] = score
+            insort(self._ranking, (-score, self._seq[contact.id], contact.id))
+
+        due_at = self.prioritizer.next_score_change(
+            contact,
+            self._interactions,
+            now
+        )
+        if due_at is None:
+            self._due_at.pop(contact.id, None)
+        elif self._due_at.get(contact.id) != due_at:
+            self._due_at[contact.id] = due_at
+            heapq.heappush(self._due, (due_at, self._seq[contact.id], contact.id))
+
+    def _unrank(self, contact_id) -> None:
+        score = self._scores.get(contact_id)
+        if score is None:
+            return
+        key = (-score, self._seq[contact_id], contact_id)
+        pos = bisect_left(self._ranking, key)
+        if pos < len(self._ranking) and self._ranking[pos] == key:
+            del self._ranking[pos]
+
+    # -------- Reads --------
+
+    def ranked(
+        self,
+        limit: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> List[Contact]:
+        """Contacts by priority (highest first), recomputing only what changed"""
+        self.refresh(now)
+        entries = self._ranking[:limit] if limit else self._ranking
+        return [self._contacts[contact_id] for _, _, contact_id in entries]
+
+    def score(self, contact_id, now: Optional[datetime] = None) -> Optional[float]:
+        self.refresh(now)
+        return self._scores.get(contact_id)
+
+    def next_due(self) -> Optional[datetime]:
+        """Earliest pending boundary crossing, if any"""
+        while self._due:
+            due_at, _, contact_id = self._due[0]
+            if self._due_at.get(contact_id) == due_at:
+                return due_at
+            heapq.heappop(self._due)
+        return None
+
+
+class ScoreStoreRegistry:
+    """
+    One PriorityScoreStore per owner, bounded to the `max_owners` most
+    recently used.
+
+    The stores are per process: every worker keeps its own copy. Callers
+    persist changes first and then replay whatever the local store has not
+    seen (its `version` onwards) under `lock(owner)`, so after a restart,
+    an eviction, or a sync handled by another worker the store is rebuilt
+    or caught up from the shared record instead of diverging.
+    """
+
+    def __init__(self, prioritizer: Optional[ContactPrioritization] = None, max_owners: int = 256):
+        self.prioritizer = prioritizer or ContactPrioritization()
+        self.max_owners = max_owners
+        self._stores: "OrderedDict[str, PriorityScoreStore]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._stores)
+
+    def lock(self, owner: str) -> asyncio.Lock:
+        """Serializes catch-up for one owner (interaction replay is not idempotent)"""
+        lock = self._locks.get(owner)
+        if lock is None:
+            lock = self._locks[owner] = asyncio.Lock()
+        return lock
+
+    def get(self, owner: str) -> PriorityScoreStore:
+        store = self._stores.get(owner)
+        if store is None:
+            store = self._stores[owner] = PriorityScoreStore(self.prioritizer)
+            while len(self._stores) > self.max_owners:
+                evicted, _ = self._stores.popitem(last=False)
+                lock = self._locks.get(evicted)
+                if lock is not None and not lock.locked():
+                    del self._locks[evicted]
+        else:
+            self._stores.move_to_end(owner)
+        return store
@@ -0,0 +1,177 @@
+import asyncio
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..Config import settings
+from ..Schemas import Contact, Interaction
+from .prioritization import ContactColumns, ContactPrioritization, top_k_indices
+
+
+# Contacts converted to columns per NumPy call
+BUILD_CHUNK_SIZE = 4096
+
+
+def _score_shard(
+    last_interaction: np.ndarray,
+    relationship: np.ndarray,
+    warmth: np.ndarray,
+    interaction_count: Optional[np.ndarray],
+    offset: int,
+    limit: Optional[int],
+    now: datetime,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Worker entry point: score one shard of column arrays and return
+    (global indices, scores) of its top `limit` contacts, best first.
+    """
+    columns = ContactColumns(last_interaction, relationship, warmth, interaction_count)
+    scores = ContactPrioritization().score_columns(columns, now)
+    top = top_k_indices(scores, limit)
+    return top + offset, scores[top]
+
+
+def _build_columns(
+    contacts: List[Contact],
+    interactions: Optional[List[Interaction]],
+    now: datetime,
+) -> ContactColumns:
+    """Columns plus last-year interaction counts (same as InteractionIndex.counts_since)"""
+    counts = None
+    if interactions:
+        since = now - timedelta(days=365)
+        counts = Counter(i.contact_id for i in interactions if i.date > since)
+
+    # Converted in chunks: one NumPy call over all contacts holds the GIL
+    # long enough to stall the event loop
+    chunks = [
+        ContactColumns.from_contacts(contacts[i:i + BUILD_CHUNK_SIZE], counts)
+        for i in range(0, len(contacts), BUILD_CHUNK_SIZE)
+    ]
+    return ContactColumns(
+        np.concatenate([c.last_interaction for c in chunks]),
+        np.concatenate([c.relationship for c in chunks]),
+        np.concatenate([c.warmth for c in chunks]),
+        None if counts is None else np.concatenate([c.interaction_count for c in chunks]),
+    )
+
+
+class ShardedPrioritizer:
+    """
+    Prioritizes very large contact batches across a process pool.
+
+    The contact models are reduced to ContactColumns in a thread, so only
+    NumPy arrays are pickled to the workers. The arrays are split into
+    contiguous shards and the per-shard top-k results are merged. Scores
+    and tie order match ContactPrioritization.prioritize_contacts.
+    Single-CPU hosts and batches below `min_contacts` are scored in the
+    thread without the pool, where worker overhead would not pay off.
+    """
+
+    def __init__(self, workers: Optional[int] = None, min_contacts: int = 0):
+        self.workers = workers or os.cpu_count() or 1
+        self.min_contacts = min_contacts
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _use_pool(self, n: int) -> bool:
+        return self.workers > 1 and n >= max(self.min_contacts, self.workers)
+
+    async def score(
+        self,
+        contacts: List[Contact],
+        interactions: Optional[List[Interaction]],
+        limit: Optional[int],
+        now: datetime,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(indices, scores) of the top `limit` contacts, best first"""
+        if not self._use_pool(len(contacts)):
+            def score_here():
+                scores = ContactPrioritization().score_columns(_build_columns(contacts, interactions, now), now)
+                top = top_k_indices(scores, limit)
+                return top, scores[top]
+            return await asyncio.to_thread(score_here)
+
+        columns = await asyncio.to_thread(_build_columns, contacts, interactions, now)
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        shard_size = -(-len(columns) // self.workers)  # ceil
+
+        def part(array, offset):
+            return None if array is None else array[offset:offset + shard_size]
+
+        results = await asyncio.gather(*(
+            loop.run_in_executor(
+                pool,
+                _score_shard,
+                part(columns.last_interaction, offset),
+                part(columns.relationship, offset),
+                part(columns.warmth, offset),
+                part(columns.interaction_count, offset),
+                offset,
+                limit,
+                now,
+            )
+            for offset in range(0, len(columns), shard_size)
+        ))
+
+        # Shards are in input order and each is sorted with ties by index,
+        # so merging by position keeps the global stable tie order.
+        indices = np.concatenate([idx for idx, _ in results])
+        scores = np.concatenate([sc for _, sc in results])
+        order = top_k_indices(scores, limit)
+        return indices[order], scores[order]
+
+    async def prioritize_contacts(
+        self,
+        contacts: List[Contact],
+        interactions: List[Interaction] = None,
+        limit: int = None,
+    ) -> List[Contact]:
+        """
+        Sharded equivalent of ContactPrioritization.prioritize_contacts.
+        Only the returned contacts get their priority_score set.
+        """
+        if not contacts:
+            return []
+
+        indices, scores = await self.score(contacts, interactions, limit, datetime.now())
+
+        prioritized = []
+        for i, score in zip(indices.tolist(), scores.tolist()):
+            contact = contacts[i]
+            contact.priority_score = score
+            prioritized.append(contact)
+        return prioritized
+
+
+_sharded: Optional[ShardedPrioritizer] = None
+
+
+def get_sharded_prioritizer() -> ShardedPrioritizer:
+    """App-wide ShardedPrioritizer sized by PRIORITIZATION_WORKERS"""
+    global _sharded
+    if _sharded is None:
+        _sharded = ShardedPrioritizer(
+            settings.prioritization_workers,
+            min_contacts=settings.prioritization_shard_threshold
+        )
+    return _sharded
+
+
+def shutdown_sharded_prioritizer() -> None:
+    if _sharded is not None:
+        _sharded.shutdown()
@@ -0,0 +1,384 @@
+# App/cache.py
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+try:  # optional: shared invalidation across workers
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - depends on the deployment
+    aioredis = None
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "tags")
+
+    def __init__(self, value: Any, expires_at: float, tags: Set[str]):
+        self.value = value
+        self.expires_at = expires_at
+        self.tags = tags
+
+
+class InvalidationBackend:
+    """
+    Carries invalidations between processes. The default does nothing:
+    each worker only sees its own writes, and the TTL bounds how stale
+    another worker's cache can get.
+    """
+
+    async def start(self, on_message: Callable[[Iterable[str]], None]) -> None:
+        pass
+
+    async def publish(self, tags: Iterable[str]) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class RedisInvalidationBackend(InvalidationBackend):
+    """
+    Broadcasts invalidated tags over Redis pub/sub so every uvicorn worker
+    drops the same entries. Requires the `redis` package.
+    """
+
+    def __init__(self, url: str, channel: str = "propelme:cache-invalidate"):
+        if aioredis is None:
+            raise RuntimeError("CACHE_REDIS_URL is set but the redis package is not installed")
+        self.url = url
+        self.channel = channel
+        self.origin = uuid.uuid4().hex  # ignore our own broadcasts
+        self._client = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self, on_message: Callable[[Iterable[str]], None]) -> None:
+        self._client = aioredis.from_url(self.url)
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(on_message))
+
+    async def _listen(self, on_message: Callable[[Iterable[str]], None]) -> None:
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                payload = json.loads(message["data"])
+            except ValueError:
+                continue
+            if payload.get("origin") != self.origin:
+                on_message(payload.get("tags", []))
+
+    async def publish(self, tags: Iterable[str]) -> None:
+        await self._client.publish(
+            self.channel,
+            json.dumps({"origin": self.origin, "tags": list(tags)}),
+        )
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+
+
+class ListingCache:
+    """
+    In-process read-through cache for list endpoints.
+
+    Entries are keyed by (namespace, key), bounded by `max_entries` (least
+    recently used evicted first) and expire after `ttl_seconds`. Each entry
+    carries tags (e.g. "job:42" for every row on a page, plus its
+    namespace) so a write drops exactly the pages it affects. Values are
+    shared between requests: treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 30.0,
+        backend: Optional[InvalidationBackend] = None,
+        enabled: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend or InvalidationBackend()
+        self.enabled = enabled
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+        self._by_tag: Dict[str, Set[Tuple[str, Hashable]]] = {}
+        # Bumped on every invalidation; a load that straddles one is not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -------- Lifecycle --------
+
+    async def start(self) -> None:
+        await self.backend.start(self._invalidate_local)
+
+    async def stop(self) -> None:
+        await self.backend.stop()
+
+    # -------- Reads --------
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        tags: Callable[[Any], Iterable[str]] = lambda value: (),
+    ) -> Any:
+        """
+        Return the cached value, or await `loader()`, cache and return it.
+        `tags(value)` names what the value depends on.
+        """
+        if not self.enabled:
+            return await loader()
+
+        full_key = (namespace, key)
+        entry = self._entries.get(full_key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return entry.value
+            self.expirations += 1
+            self._drop(full_key)
+
+        self.misses += 1
+        generation = self._generation
+        value = await loader()
+        if generation == self._generation:
+            self._store(full_key, value, {namespace, *tags(value)})
+        return value
+
+    def _store(self, full_key: Tuple[str, Hashable], value: Any, tags: Set[str]) -> None:
+        self._drop(full_key)
+        self._entries[full_key] = _Entry(value, time.monotonic() + self.ttl_seconds, tags)
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(full_key)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, full_key: Tuple[str, Hashable]) -> None:
+        entry = self._entries.pop(full_key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(full_key)
+                if not keys:
+                    del self._by_tag[tag]
+
+    # -------- Invalidation --------
+
+    def _invalidate_local(self, tags: Iterable[str]) -> None:
+        self._generation += 1
+        for tag in tags:
+            for full_key in list(self._by_tag.get(tag, ())):
+                self._drop(full_key)
+                self.invalidations += 1
+
+    async def invalidate(self, *tags: str) -> None:
+        """
+        Drop every entry carrying any of `tags` here and, through the
+        backend, in the other workers. Call after the write has committed.
+        """
+        if not tags:
+            return
+        self._invalidate_local(tags)
+        try:
+            await self.backend.publish(tags)
+        except Exception as e:
+            # The TTL still bounds staleness elsewhere; never fail the write
+            logger.warning("Cache invalidation broadcast failed: %s", e)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._by_tag.clear()
+
+    # -------- Monitoring --------
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+class _TimedEntry:
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class ResponseCache:
+    """
+    In-process cache for slow upstream lookups (e.g. third-party APIs).
+
+    Bounded by `max_entries` (least recently used evicted first). Each value
+    gets its own TTL from `ttl(value)`, so one cache can hold long-lived
+    details, short-lived searches and short negative results; returning None
+    skips caching (e.g. for transient errors). For `stale_seconds` after an
+    entry expires it is still served while a single background load
+    refreshes it. Concurrent misses for one key share a single load.
+    Values are shared between requests: treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int = 512, stale_seconds: float = 0.0, enabled: bool = True):
+        self.max_entries = max_entries
+        self.stale_seconds = stale_seconds
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, _TimedEntry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refresh_errors = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Callable[[Any], Optional[float]],
+    ) -> Any:
+        if not self.enabled:
+            return await loader()
+
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.fresh_until > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            if entry.stale_until > now:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    self._start_load(key, loader, ttl).add_done_callback(self._log_refresh_error)
+                return entry.value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = self._start_load(key, loader, ttl)
+        else:
+            self.coalesced += 1
+        # Shielded so one cancelled request does not abort the shared load
+        return await asyncio.shield(task)
+
+    def _start_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Callable[[Any], Optional[float]],
+    ) -> asyncio.Task:
+        task = asyncio.create_task(self._load(key, loader, ttl))
+        self._inflight[key] = task
+        return task
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Callable[[Any], Optional[float]],
+    ) -> Any:
+        try:
+            value = await loader()
+            seconds = ttl(value)
+            if seconds is not None and seconds > 0:
+                self._store(key, value, seconds)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(self, key: Hashable, value: Any, seconds: float) -> None:
+        fresh_until = time.monotonic() + seconds
+        self._entries.pop(key, None)
+        self._entries[key] = _TimedEntry(value, fresh_until, fresh_until + self.stale_seconds)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _log_refresh_error(self, task: asyncio.Task) -> None:
+        # The stale value keeps being served until it runs out
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.refresh_errors += 1
+            logger.warning("Background cache refresh failed: %s", error)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "stale_seconds": self.stale_seconds,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "refresh_errors": self.refresh_errors,
+            "evictions": self.evictions,
+            "inflight": len(self._inflight),
+        }
+
+
+def _make_backend() -> InvalidationBackend:
+    if settings.cache_redis_url:
+        return RedisInvalidationBackend(settings.cache_redis_url)
+    return InvalidationBackend()
+
+
+listing_cache = ListingCache(
+    max_entries=settings.cache_max_entries,
+    ttl_seconds=settings.cache_ttl_seconds,
+    backend=_make_backend(),
+    enabled=settings.cache_enabled,
+)
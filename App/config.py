@@ -19,8 +19,68 @@ class Settings:
         "https://propelme-backend-409735787031.us-central1.run.app/auth/linkedin/callback"
     )
     
+    # Database (asyncpg pool)
+    db_connection_url: str | None = os.getenv("DB_CONNECTION_URL")
+    db_pool_min_size: int = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+    db_pool_max_size: int = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    # Seconds a request may wait for a free connection before a 503
+    db_pool_acquire_timeout: float = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", "5"))
+    # Idle connections are closed after this many seconds (0 = never)
+    db_pool_max_idle_seconds: float = float(os.getenv("DB_POOL_MAX_IDLE_SECONDS", "300"))
+    # Connections are recycled after serving this many queries
+    db_pool_max_queries: int = int(os.getenv("DB_POOL_MAX_QUERIES", "50000"))
+    # Statements slower than this are logged as warnings
+    db_slow_query_ms: float = float(os.getenv("DB_SLOW_QUERY_MS", "250"))
+    # Adds an X-DB-Summary header (queries, DB time, acquire wait) to every response
+    db_debug_summary: bool = os.getenv("DB_DEBUG_SUMMARY", "false").lower() == "true"
+    
+    # Listing cache (GET /jobs/, GET /planner/tasks)
+    cache_enabled: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+    cache_ttl_seconds: float = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+    cache_max_entries: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+    # Redis URL for sharing invalidations between workers (needs `redis`)
+    cache_redis_url: str | None = os.getenv("CACHE_REDIS_URL")
+    
     # Eventbrite
     eventbrite_api_key: str | None = os.getenv("EVENTBRITE_API_KEY")
+    # Shared HTTP client: connection pool size and default timeout (seconds)
+    eventbrite_max_connections: int = int(os.getenv("EVENTBRITE_MAX_CONNECTIONS", "20"))
+    eventbrite_max_keepalive: int = int(os.getenv("EVENTBRITE_MAX_KEEPALIVE", "10"))
+    eventbrite_timeout_seconds: float = float(os.getenv("EVENTBRITE_TIMEOUT_SECONDS", "10"))
+    # Eventbrite response cache: TTLs per lookup kind, 404s, and how long an
+    # expired entry is still served while it is refreshed in the background
+    eventbrite_cache_enabled: bool = os.getenv("EVENTBRITE_CACHE_ENABLED", "true").lower() == "true"
+    eventbrite_cache_max_entries: int = int(os.getenv("EVENTBRITE_CACHE_MAX_ENTRIES", "512"))
+    eventbrite_search_ttl_seconds: float = float(os.getenv("EVENTBRITE_SEARCH_TTL_SECONDS", "300"))
+    eventbrite_details_ttl_seconds: float = float(os.getenv("EVENTBRITE_DETAILS_TTL_SECONDS", "3600"))
+    eventbrite_not_found_ttl_seconds: float = float(os.getenv("EVENTBRITE_NOT_FOUND_TTL_SECONDS", "120"))
+    eventbrite_stale_seconds: float = float(os.getenv("EVENTBRITE_STALE_SECONDS", "600"))
+    # /events/recommendations: parallel interest searches and overall time budget
+    events_search_concurrency: int = int(os.getenv("EVENTS_SEARCH_CONCURRENCY", "4"))
+    # Events streamed per interest (Eventbrite pages hold 50)
+    events_per_interest: int = int(os.getenv("EVENTS_PER_INTEREST", "150"))
+    # Local event index, rebuilt in the background from these seed searches
+    # (every keyword in every location; no locations = Eventbrite's default)
+    event_index_enabled: bool = os.getenv("EVENT_INDEX_ENABLED", "true").lower() == "true"
+    event_index_keywords: str = os.getenv(
+        "EVENT_INDEX_KEYWORDS", "networking,technology,business,professional development"
+    )
+    event_index_locations: str | None = os.getenv("EVENT_INDEX_LOCATIONS")
+    event_index_refresh_seconds: float = float(os.getenv("EVENT_INDEX_REFRESH_SECONDS", "900"))
+    event_index_horizon_days: int = int(os.getenv("EVENT_INDEX_HORIZON_DAYS", "60"))
+    event_index_max_events_per_query: int = int(os.getenv("EVENT_INDEX_MAX_EVENTS_PER_QUERY", "500"))
+    event_index_cell_degrees: float = float(os.getenv("EVENT_INDEX_CELL_DEGREES", "0.25"))
+    events_recommendation_deadline_seconds: float = float(
+        os.getenv("EVENTS_RECOMMENDATION_DEADLINE_SECONDS", "8")
+    )
+    
+    # Contact prioritization
+    # 0 = one worker process per CPU
+    prioritization_workers: int = int(os.getenv("PRIORITIZATION_WORKERS", "0"))
+    # Requests with at least this many contacts are scored in the process pool
+    prioritization_shard_threshold: int = int(
+        os.getenv("PRIORITIZATION_SHARD_THRESHOLD", "100000")
+    )
     
     def validate(self):
         if not self.google_project_id:
@@ -33,4 +93,7 @@ class Settings:
         return bool(self.eventbrite_api_key)
 
 settings = Settings()
+
+def get_settings() -> Settings:
+    return settings
 EOF
@@ -1,26 +1,300 @@
 # App/Db.py
-from typing import AsyncGenerator, Optional, List, Any, Dict
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from typing import AsyncGenerator, AsyncIterable, AsyncIterator, Optional, List, Any, Dict, Tuple
 import asyncpg
+from fastapi import HTTPException
 from .config import get_settings  # make sure file is app/config.py (lowercase)
+from .statements import statements
+from .cache import listing_cache
+from .metrics import Histogram, current_request_stats, render_histogram, render_metric
 
 settings = get_settings()
 
+_pool: Optional[asyncpg.Pool] = None
+_pool_lock = asyncio.Lock()
+_waiting = 0  # requests currently waiting in pool.acquire()
+_acquire_wait = Histogram()  # seconds spent in pool.acquire()
+
+
+# -------- Schema --------
+# All SQL lives in the statement registry (App/statements.py): each helper
+# below runs a named statement that every pooled connection prepares once.
+
+# Tables this module owns; created on startup if missing. The rollup table
+# holds per-contact, per-day interaction counts so scoring reads at most
+# ~365 small rows per contact instead of its raw interaction history.
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id                    bigserial PRIMARY KEY,
+    name                  text NOT NULL,
+    email                 text,
+    linkedin_url          text,
+    company               text,
+    title                 text,
+    location              text,
+    relationship          text,
+    warmth_score          double precision NOT NULL DEFAULT 0,
+    last_interaction_date timestamp,
+    source                text NOT NULL DEFAULT 'manual',
+    tags                  text[] NOT NULL DEFAULT '{}',
+    notes                 text,
+    created_at            timestamp NOT NULL DEFAULT now(),
+    updated_at            timestamp NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS contact_interactions (
+    id               bigserial PRIMARY KEY,
+    contact_id       bigint NOT NULL REFERENCES contacts (id) ON DELETE CASCADE,
+    date             timestamp NOT NULL,
+    type             text NOT NULL,
+    notes            text NOT NULL DEFAULT '',
+    sentiment        text NOT NULL DEFAULT 'neutral',
+    follow_up_needed boolean NOT NULL DEFAULT false,
+    follow_up_date   timestamp
+);
+
+CREATE INDEX IF NOT EXISTS contact_interactions_contact_date_idx
+    ON contact_interactions (contact_id, date);
+
+-- Date-led indexes for the prioritization aggregates, which filter every
+-- contact's rows by date: the one-day boundary read of raw interactions
+-- and the last-year / recent-sentiment reads of the rollup
+CREATE INDEX IF NOT EXISTS contact_interactions_date_idx
+    ON contact_interactions (date);
+
+CREATE TABLE IF NOT EXISTS contact_interaction_daily (
+    contact_id   bigint NOT NULL REFERENCES contacts (id) ON DELETE CASCADE,
+    day          date NOT NULL,
+    interactions integer NOT NULL DEFAULT 0,
+    positive     integer NOT NULL DEFAULT 0,
+    neutral      integer NOT NULL DEFAULT 0,
+    negative     integer NOT NULL DEFAULT 0,
+    PRIMARY KEY (contact_id, day)
+);
+
+CREATE INDEX IF NOT EXISTS contact_interaction_daily_day_idx
+    ON contact_interaction_daily (day);
+
+CREATE TABLE IF NOT EXISTS planner_tasks (
+    id          bigserial PRIMARY KEY,
+    contact_id  bigint NOT NULL,
+    action_type text NOT NULL,
+    due_date    date NOT NULL,
+    completed   boolean NOT NULL DEFAULT false
+);
+
+-- Open tasks only: the daily planner never reads completed ones, so these
+-- stay the size of the backlog rather than the full task history
+CREATE INDEX IF NOT EXISTS planner_tasks_open_due_idx
+    ON planner_tasks (due_date, id) WHERE NOT completed;
+
+CREATE INDEX IF NOT EXISTS planner_tasks_open_contact_due_idx
+    ON planner_tasks (contact_id, due_date, id) WHERE NOT completed;
+
+-- Inputs of the incremental priority score store, per owner. Every sync
+-- bumps the owner's version and stamps its rows with it, so each worker
+-- can replay just the changes its in-memory store has not seen yet.
+CREATE TABLE IF NOT EXISTS priority_store_versions (
+    owner   text PRIMARY KEY,
+    version bigint NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS priority_store_contacts (
+    owner      text NOT NULL,
+    contact_id bigint NOT NULL,
+    contact    jsonb NOT NULL,
+    version    bigint NOT NULL,
+    PRIMARY KEY (owner, contact_id)
+);
+
+CREATE INDEX IF NOT EXISTS priority_store_contacts_version_idx
+    ON priority_store_contacts (owner, version);
+
+CREATE TABLE IF NOT EXISTS priority_store_interactions (
+    id          bigserial PRIMARY KEY,
+    owner       text NOT NULL,
+    interaction jsonb NOT NULL,
+    version     bigint NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS priority_store_interactions_version_idx
+    ON priority_store_interactions (owner, version, id);
+
+-- Full (due_date, id) order for the paginated listing and export, which
+-- include completed tasks
+CREATE INDEX IF NOT EXISTS planner_tasks_due_idx
+    ON planner_tasks (due_date, id);
+"""
+
+ENSURE_SCHEMA = statements.register("schema.ensure", SCHEMA_SQL, prepare=False)
+
+
+async def ensure_schema(conn: asyncpg.Connection) -> None:
+    """
+    Create missing tables and indexes (idempotent).
+    """
+    await statements.execute(conn, ENSURE_SCHEMA)
+
+
+# -------- Connection pool --------
+
+async def init_db_pool() -> asyncpg.Pool:
+    """
+    Create the shared connection pool (idempotent). Called from the app
+    lifespan; get_db also calls it lazily for entry points without one.
+    """
+    global _pool
+    async with _pool_lock:
+        if _pool is None:
+            if not settings.db_connection_url:
+                raise RuntimeError("DB_CONNECTION_URL is not set")
+
+            # Schema first, so new pool connections can prepare every statement
+            conn = await asyncpg.connect(settings.db_connection_url)
+            try:
+                await ensure_schema(conn)
+            finally:
+                await conn.close()
+
+            _pool = await asyncpg.create_pool(
+                settings.db_connection_url,
+                min_size=settings.db_pool_min_size,
+                max_size=settings.db_pool_max_size,
+                max_queries=settings.db_pool_max_queries,
+                max_inactive_connection_lifetime=settings.db_pool_max_idle_seconds,
+                init=statements.prepare_all,
+            )
+    return _pool
+
+
+async def close_db_pool() -> None:
+    """
+    Close the shared pool, waiting for checked-out connections to be released.
+    """
+    global _pool
+    async with _pool_lock:
+        if _pool is not None:
+            await _pool.close()
+            _pool = None
+
+
+def pool_stats() -> Dict[str, Any]:
+    """
+    Snapshot of pool usage for monitoring.
+    """
+    if _pool is None:
+        return {"initialized": False, "waiting": _waiting}
+    size = _pool.get_size()
+    idle = _pool.get_idle_size()
+    return {
+        "initialized": True,
+        "min_size": _pool.get_min_size(),
+        "max_size": _pool.get_max_size(),
+        "size": size,
+        "in_use": size - idle,
+        "idle": idle,
+        "waiting": _waiting,
+    }
+
+
+def pool_metrics_lines() -> List[str]:
+    """
+    Pool gauges and the acquire-wait histogram in Prometheus text format.
+    """
+    stats = pool_stats()
+    gauges = [({"state": "waiting"}, stats["waiting"])]
+    if stats["initialized"]:
+        gauges += [
+            ({"state": "in_use"}, stats["in_use"]),
+            ({"state": "idle"}, stats["idle"]),
+        ]
+    return [
+        *render_metric(
+            "propelme_db_pool_connections",
+            "gauge",
+            "Pool connections by state (waiting = requests queued for one).",
+            gauges,
+        ),
+        *render_histogram(
+            "propelme_db_pool_acquire_wait_seconds",
+            "Time requests waited for a pooled connection.",
+            [({}, _acquire_wait)],
+        ),
+    ]
+
 
 async def get_db() -> AsyncGenerator[asyncpg.Connection, None]:
     """
-    FastAPI dependency: yields an asyncpg connection and closes it afterwards.
+    FastAPI dependency: yields a pooled asyncpg connection and releases it afterwards.
+    """
+    global _waiting
+    pool = _pool or await init_db_pool()
+
+    _waiting += 1
+    start = time.perf_counter()
+    try:
+        conn = await pool.acquire(timeout=settings.db_pool_acquire_timeout)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="Database busy, try again")
+    finally:
+        _waiting -= 1
+        waited = time.perf_counter() - start
+        _acquire_wait.observe(waited)
+        request_stats = current_request_stats()
+        if request_stats is not None:
+            request_stats.acquire_seconds += waited
+
+    try:
+        yield conn
+    finally:
+        await pool.release(conn)
+
+
+@asynccontextmanager
+async def pooled_connection() -> AsyncIterator[asyncpg.Connection]:
     """
-    if not settings.db_connection_url:
-        raise RuntimeError("DB_CONNECTION_URL is not set")
-    conn = await asyncpg.connect(settings.db_connection_url)
+    Hold a pooled connection for the lifetime of a streaming response.
+    FastAPI finishes yield dependencies before a StreamingResponse body
+    runs, so streaming endpoints acquire their own connection here.
+    """
+    agen = get_db()
+    conn = await agen.__anext__()
     try:
         yield conn
     finally:
-        await conn.close()
+        await agen.aclose()
 
 
 # -------- Job applications helpers --------
 
+INSERT_JOB = statements.register(
+    "jobs.insert",
+    """
+    INSERT INTO job_applications (
+        company,
+        role_title,
+        link,
+        status,
+        contact_name,
+        contact_linkedin_url,
+        notes
+    )
+    VALUES ($1,$2,$3,$4,$5,$6,$7)
+    RETURNING id,
+              company,
+              role_title,
+              link,
+              status,
+              contact_name,
+              contact_linkedin_url,
+              notes;
+    """,
+)
+
+
 async def insert_job_application(
     conn: asyncpg.Connection,
     data: Dict[str, Any],
@@ -30,27 +304,9 @@ async def insert_job_application(
     Expects keys: company, role_title, link, status, contact_name,
                   contact_linkedin_url, notes
     """
-    row = await conn.fetchrow(
-        """
-        INSERT INTO job_applications (
-            company,
-            role_title,
-            link,
-            status,
-            contact_name,
-            contact_linkedin_url,
-            notes
-        )
-        VALUES ($1,$2,$3,$4,$5,$6,$7)
-        RETURNING id,
-                  company,
-                  role_title,
-                  link,
-                  status,
-                  contact_name,
-                  contact_linkedin_url,
-                  notes;
-        """,
+    row = await statements.fetchrow(
+        conn,
+        INSERT_JOB,
         data["company"],
         data["role_title"],
         data.get("link", ""),
@@ -59,27 +315,215 @@ async def insert_job_application(
         data.get("contact_linkedin_url", ""),
         data.get("notes", ""),
     )
+    # New ids sort first, so only first pages change
+    await listing_cache.invalidate("jobs:head")
     return dict(row)
 
 
+JOB_COLUMNS = """
+    id,
+    company,
+    role_title,
+    link,
+    status,
+    contact_name,
+    contact_linkedin_url,
+    notes
+"""
+
+# First page and later pages are separate statements: a prepared generic
+# plan cannot use the index for "$1 IS NULL OR id < $1", so deep pages
+# would scan from the top.
+LIST_JOBS_FIRST_PAGE = statements.register(
+    "jobs.list_first_page",
+    f"""
+    SELECT {JOB_COLUMNS}
+    FROM job_applications
+    ORDER BY id DESC
+    LIMIT $1;
+    """,
+)
+
+LIST_JOBS_PAGE_BEFORE = statements.register(
+    "jobs.list_page_before",
+    f"""
+    SELECT {JOB_COLUMNS}
+    FROM job_applications
+    WHERE id < $1
+    ORDER BY id DESC
+    LIMIT $2;
+    """,
+)
+
+
 async def list_job_applications(
     conn: asyncpg.Connection,
-) -> list[Dict[str, Any]]:
-    rows = await conn.fetch(
-        """
-        SELECT id,
-               company,
-               role_title,
-               link,
-               status,
-               contact_name,
-               contact_linkedin_url,
-               notes
-        FROM job_applications
-        ORDER BY id DESC;
-        """
+    limit: int = 100,
+    before_id: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    One keyset page of job applications, newest first.
+    Returns (rows, next_before_id); next_before_id is None on the last page.
+    Pass it back as before_id to fetch the following page.
+    Pages are served from listing_cache, tagged with their row ids.
+    """
+    async def load():
+        if before_id is None:
+            rows = await statements.fetch(conn, LIST_JOBS_FIRST_PAGE, limit + 1)
+        else:
+            rows = await statements.fetch(conn, LIST_JOBS_PAGE_BEFORE, before_id, limit + 1)
+        page = [dict(r) for r in rows[:limit]]
+        next_before_id = page[-1]["id"] if len(rows) > limit else None
+        return page, next_before_id
+
+    def tags(result):
+        page_tags = [f"job:{row['id']}" for row in result[0]]
+        if before_id is None:
+            page_tags.append("jobs:head")
+        return page_tags
+
+    return await listing_cache.get_or_load("jobs", (limit, before_id), load, tags)
+
+
+EXPORT_JOBS = statements.register(
+    "jobs.export",
+    f"""
+    SELECT {JOB_COLUMNS}
+    FROM job_applications
+    ORDER BY id DESC;
+    """,
+)
+
+
+async def iter_job_applications(
+    conn: asyncpg.Connection,
+    prefetch: int = 500,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream every job application, newest first, through a server-side
+    cursor so only `prefetch` rows are held in memory at a time.
+    """
+    async with conn.transaction():
+        async for row in statements.cursor(
+            conn,
+            EXPORT_JOBS,
+            prefetch=prefetch,
+        ):
+            yield dict(row)
+
+
+CREATE_JOB_IMPORT_STAGING = statements.register(
+    "jobs.import.create_staging",
+    """
+    CREATE TEMP TABLE job_import_staging (
+        line                 integer,
+        company              text,
+        role_title           text,
+        link                 text,
+        status               text,
+        contact_name         text,
+        contact_linkedin_url text,
+        notes                text
+    ) ON COMMIT DROP;
+    """,
+    prepare=False,
+)
+
+
+LOCK_JOBS_FOR_IMPORT = statements.register(
+    "jobs.import.lock",
+    "LOCK TABLE job_applications IN SHARE ROW EXCLUSIVE MODE;",
+    prepare=False,
+)
+
+
+INSERT_NEW_IMPORTED_JOBS = statements.register(
+    "jobs.import.insert_new",
+    """
+    WITH new_rows AS (
+        INSERT INTO job_applications (
+            company,
+            role_title,
+            link,
+            status,
+            contact_name,
+            contact_linkedin_url,
+            notes
+        )
+        SELECT company, role_title, link, status,
+               contact_name, contact_linkedin_url, notes
+        FROM (
+            SELECT DISTINCT ON (company, role_title, link) *
+            FROM job_import_staging s
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM job_applications j
+                WHERE j.company = s.company
+                  AND j.role_title = s.role_title
+                  AND COALESCE(j.link, '') = s.link
+            )
+            ORDER BY company, role_title, link, line
+        ) first_rows
+        ORDER BY line
+        RETURNING 1
     )
-    return [dict(r) for r in rows]
+    SELECT count(*) FROM new_rows;
+    """,
+    prepare=False,
+)
+
+
+async def import_job_applications(
+    conn: asyncpg.Connection,
+    batches: AsyncIterable[List[Tuple]],
+) -> Tuple[int, int]:
+    """
+    Bulk-load job applications through COPY into a temporary staging
+    table, then insert the rows not already present in one statement.
+    Each record is (line, company, role_title, link, status, contact_name,
+    contact_linkedin_url, notes). Rows matching an existing job, or an
+    earlier row of the same upload, on company + role_title + link are
+    skipped, so re-running an import is a no-op.
+    Returns (staged, inserted).
+    """
+    async with conn.transaction():
+        await statements.execute(conn, CREATE_JOB_IMPORT_STAGING)
+
+        staged = 0
+        async for batch in batches:
+            await conn.copy_records_to_table("job_import_staging", records=batch)
+            staged += len(batch)
+        if not staged:
+            return 0, 0
+
+        # Serialise concurrent imports so the duplicate check stays exact
+        await statements.execute(conn, LOCK_JOBS_FOR_IMPORT)
+        inserted = await statements.fetchval(conn, INSERT_NEW_IMPORTED_JOBS)
+    if inserted:
+        await listing_cache.invalidate("jobs:head")
+    return staged, inserted
+
+
+UPDATE_JOB_STATUS = statements.register(
+    "jobs.update_status",
+    """
+    UPDATE job_applications
+    SET status = $2,
+        notes = CASE
+                    WHEN $3 IS NULL OR $3 = '' THEN notes
+                    ELSE COALESCE(notes, '') || '\n' || $3
+                END
+    WHERE id = $1
+    RETURNING id,
+              company,
+              role_title,
+              link,
+              status,
+              contact_name,
+              contact_linkedin_url,
+              notes;
+    """,
+)
 
 
 async def update_job_status(
@@ -89,36 +533,632 @@ async def update_job_status(
     notes_append: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
-    Update status (and optionally append to notes), then return updated row.
+    Update status (and optionally append to notes) and return the updated
+    row in the same statement.
     """
-    await conn.execute(
-        """
-        UPDATE job_applications
-        SET status = $2,
-            notes = CASE
-                        WHEN $3 IS NULL OR $3 = '' THEN notes
-                        ELSE COALESCE(notes, '') || '\n' || $3
-                    END
-        WHERE id = $1
-        """,
+    row = await statements.fetchrow(
+        conn,
+        UPDATE_JOB_STATUS,
         job_id,
         status,
         notes_append,
     )
+    if not row:
+        return {}
+    await listing_cache.invalidate(f"job:{job_id}")
+    return dict(row)
+
 
-    row = await conn.fetchrow(
-        """
-        SELECT id,
-               company,
-               role_title,
-               link,
-               status,
-               contact_name,
-               contact_linkedin_url,
-               notes
-        FROM job_applications
+BULK_UPDATE_JOB_STATUS = statements.register(
+    "jobs.bulk_update_status",
+    """
+    UPDATE job_applications AS j
+    SET status = c.status,
+        notes = CASE
+                    WHEN c.notes_append IS NULL OR c.notes_append = '' THEN j.notes
+                    ELSE COALESCE(j.notes, '') || '\n' || c.notes_append
+                END
+    FROM unnest($1::bigint[], $2::text[], $3::text[])
+         AS c(id, status, notes_append)
+    WHERE j.id = c.id
+    RETURNING j.id,
+              j.company,
+              j.role_title,
+              j.link,
+              j.status,
+              j.contact_name,
+              j.contact_linkedin_url,
+              j.notes;
+    """,
+)
+
+
+async def bulk_update_job_status(
+    conn: asyncpg.Connection,
+    updates: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Apply many status changes in one set-based UPDATE and return the updated
+    rows in input order. Expects dicts with keys: id, status, notes_append.
+    Repeated ids are merged first: the last status wins and notes are
+    appended in order.
+    """
+    merged: Dict[int, Dict[str, Any]] = {}
+    for update in updates:
+        job_id = update["id"]
+        notes = update.get("notes_append") or ""
+        if job_id in merged:
+            previous = merged[job_id]["notes_append"]
+            if previous and notes:
+                notes = previous + "\n" + notes
+            else:
+                notes = previous or notes
+        merged[job_id] = {"status": update["status"], "notes_append": notes}
+
+    rows = await statements.fetch(
+        conn,
+        BULK_UPDATE_JOB_STATUS,
+        list(merged),
+        [m["status"] for m in merged.values()],
+        [m["notes_append"] for m in merged.values()],
+    )
+
+    by_id = {r["id"]: dict(r) for r in rows}
+    await listing_cache.invalidate(*(f"job:{job_id}" for job_id in by_id))
+    return [by_id[job_id] for job_id in merged if job_id in by_id]
+
+
+# -------- Planner task helpers --------
+
+PLANNER_COLUMNS = """
+    id,
+    contact_id,
+    action_type,
+    to_char(due_date, 'YYYY-MM-DD') AS due_date,
+    completed
+"""
+
+
+# PLANNER_COLUMNS renders due_date as text under the same name, so ORDER
+# BY names the table column to sort (and use the index) on the real date.
+# As with jobs, first and later pages are separate statements.
+LIST_PLANNER_TASKS_FIRST_PAGE = statements.register(
+    "planner.list_first_page",
+    f"""
+    SELECT {PLANNER_COLUMNS}
+    FROM planner_tasks
+    ORDER BY planner_tasks.due_date ASC, planner_tasks.id ASC
+    LIMIT $1;
+    """,
+)
+
+LIST_PLANNER_TASKS_PAGE_AFTER = statements.register(
+    "planner.list_page_after",
+    f"""
+    SELECT {PLANNER_COLUMNS}
+    FROM planner_tasks
+    WHERE (due_date, id) > ($1::date, $2::bigint)
+    ORDER BY planner_tasks.due_date ASC, planner_tasks.id ASC
+    LIMIT $3;
+    """,
+)
+
+
+async def list_planner_tasks(
+    conn: asyncpg.Connection,
+    limit: int = 100,
+    after: Optional[Tuple[date, int]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+    """
+    One keyset page of planner tasks ordered by (due_date, id).
+    `after` is the (due_date, id) of the last row already seen.
+    Returns (rows, next_after); next_after is None on the last page.
+    Pages are served from listing_cache, tagged with their task ids.
+    """
+    after_date, after_id = after if after else (None, None)
+
+    async def load():
+        if after is None:
+            rows = await statements.fetch(conn, LIST_PLANNER_TASKS_FIRST_PAGE, limit + 1)
+        else:
+            rows = await statements.fetch(
+                conn,
+                LIST_PLANNER_TASKS_PAGE_AFTER,
+                after_date,
+                after_id,
+                limit + 1,
+            )
+        page = [dict(r) for r in rows[:limit]]
+        next_after = None
+        if len(rows) > limit:
+            next_after = (page[-1]["due_date"], page[-1]["id"])
+        return page, next_after
+
+    return await listing_cache.get_or_load(
+        "planner",
+        (limit, after_date, after_id),
+        load,
+        lambda result: [f"task:{row['id']}" for row in result[0]],
+    )
+
+
+EXPORT_PLANNER_TASKS = statements.register(
+    "planner.export",
+    f"""
+    SELECT {PLANNER_COLUMNS}
+    FROM planner_tasks
+    ORDER BY planner_tasks.due_date ASC, planner_tasks.id ASC;
+    """,
+)
+
+
+async def iter_planner_tasks(
+    conn: asyncpg.Connection,
+    prefetch: int = 500,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream every planner task in (due_date, id) order through a
+    server-side cursor.
+    """
+    async with conn.transaction():
+        async for row in statements.cursor(
+            conn,
+            EXPORT_PLANNER_TASKS,
+            prefetch=prefetch,
+        ):
+            yield dict(row)
+
+
+
+LIST_DUE_TASKS = statements.register(
+    "planner.due",
+    f"""
+    SELECT {PLANNER_COLUMNS}
+    FROM planner_tasks
+    WHERE NOT completed
+      AND due_date >= $1
+      AND due_date < $2
+    ORDER BY planner_tasks.due_date ASC, planner_tasks.id ASC
+    LIMIT $3;
+    """,
+)
+
+LIST_DUE_TASKS_FOR_CONTACT = statements.register(
+    "planner.due_for_contact",
+    f"""
+    SELECT {PLANNER_COLUMNS}
+    FROM planner_tasks
+    WHERE NOT completed
+      AND contact_id = $4
+      AND due_date >= $1
+      AND due_date < $2
+    ORDER BY planner_tasks.due_date ASC, planner_tasks.id ASC
+    LIMIT $3;
+    """,
+)
+
+
+async def list_due_planner_tasks(
+    conn: asyncpg.Connection,
+    start: date,
+    end: date,
+    contact_id: Optional[int] = None,
+    limit: int = 500,
+) -> List[Dict[str, Any]]:
+    """
+    Open tasks due in [start, end), optionally for one contact. Both
+    variants are range scans on a partial index of incomplete tasks, so
+    the cost follows the number of tasks due, not the task history.
+    """
+    if contact_id is None:
+        rows = await statements.fetch(conn, LIST_DUE_TASKS, start, end, limit)
+    else:
+        rows = await statements.fetch(
+            conn, LIST_DUE_TASKS_FOR_CONTACT, start, end, limit, contact_id
+        )
+    return [dict(r) for r in rows]
+
+
+COMPLETE_TASKS = statements.register(
+    "planner.complete",
+    f"""
+    UPDATE planner_tasks
+    SET completed = true
+    WHERE id = ANY($1::bigint[])
+      AND NOT completed
+    RETURNING {PLANNER_COLUMNS};
+    """,
+)
+
+COMPLETED_TASK_IDS = statements.register(
+    "planner.completed_ids",
+    """
+    SELECT id
+    FROM planner_tasks
+    WHERE id = ANY($1::bigint[])
+      AND completed;
+    """,
+)
+
+RESCHEDULE_TASKS = statements.register(
+    "planner.reschedule",
+    """
+    UPDATE planner_tasks AS t
+    SET due_date = c.due_date
+    FROM unnest($1::bigint[], $2::date[]) AS c(id, due_date)
+    WHERE t.id = c.id
+    RETURNING t.id,
+              t.contact_id,
+              t.action_type,
+              to_char(t.due_date, 'YYYY-MM-DD') AS due_date,
+              t.completed;
+    """,
+)
+
+
+async def bulk_update_planner_tasks(
+    conn: asyncpg.Connection,
+    complete: List[int],
+    reschedule: List[Tuple[int, date]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[int]]:
+    """
+    Mark tasks completed and move due dates in one transaction, one
+    set-based UPDATE each. For an id rescheduled more than once the last
+    date wins. Only tasks that were still open count as completed.
+    Returns (completed_rows, rescheduled_rows, already_completed_ids).
+    """
+    due_dates = dict(reschedule)
+    completed: List[Dict[str, Any]] = []
+    rescheduled: List[Dict[str, Any]] = []
+    already_completed: List[int] = []
+    async with conn.transaction():
+        if due_dates:
+            rows = await statements.fetch(
+                conn,
+                RESCHEDULE_TASKS,
+                list(due_dates),
+                list(due_dates.values()),
+            )
+            rescheduled = [dict(r) for r in rows]
+        if complete:
+            ids = list(dict.fromkeys(complete))
+            rows = await statements.fetch(conn, COMPLETE_TASKS, ids)
+            completed = [dict(r) for r in rows]
+            if len(completed) < len(ids):
+                rows = await statements.fetch(conn, COMPLETED_TASK_IDS, ids)
+                already_completed = [r["id"] for r in rows]
+
+    if rescheduled:
+        # Moved due dates reorder the listing, so every page may change
+        await listing_cache.invalidate("planner")
+    elif completed:
+        await listing_cache.invalidate(*(f"task:{row['id']}" for row in completed))
+    return completed, rescheduled, already_completed
+
+# -------- Contacts & interactions helpers --------
+
+CONTACT_COLUMNS = """
+    id,
+    name,
+    email,
+    linkedin_url,
+    company,
+    title,
+    location,
+    relationship,
+    warmth_score,
+    last_interaction_date,
+    source,
+    tags,
+    notes,
+    created_at,
+    updated_at
+"""
+
+
+INSERT_CONTACT = statements.register(
+    "contacts.insert",
+    f"""
+    INSERT INTO contacts (
+        name,
+        email,
+        linkedin_url,
+        company,
+        title,
+        location,
+        relationship,
+        warmth_score,
+        last_interaction_date,
+        source,
+        tags,
+        notes
+    )
+    VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12)
+    RETURNING {CONTACT_COLUMNS};
+    """,
+)
+
+
+async def insert_contact(
+    conn: asyncpg.Connection,
+    data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Insert a contact and return the stored row.
+    Expects Contact field names; relationship / source as plain strings.
+    """
+    row = await statements.fetchrow(
+        conn,
+        INSERT_CONTACT,
+        data["name"],
+        data.get("email"),
+        data.get("linkedin_url"),
+        data.get("company"),
+        data.get("title"),
+        data.get("location"),
+        data.get("relationship"),
+        data.get("warmth_score", 0.0),
+        data.get("last_interaction_date"),
+        data.get("source", "manual"),
+        data.get("tags") or [],
+        data.get("notes"),
+    )
+    return dict(row)
+
+
+INSERT_INTERACTION = statements.register(
+    "interactions.insert",
+    """
+    WITH new_interaction AS (
+        INSERT INTO contact_interactions (
+            contact_id,
+            date,
+            type,
+            notes,
+            sentiment,
+            follow_up_needed,
+            follow_up_date
+        )
+        SELECT id, $2, $3, $4, $5, $6, $7
+        FROM contacts
         WHERE id = $1
-        """,
-        job_id,
+        RETURNING *
+    ),
+    rollup AS (
+        INSERT INTO contact_interaction_daily AS d (
+            contact_id, day, interactions, positive, neutral, negative
+        )
+        SELECT contact_id,
+               date::date,
+               1,
+               (sentiment = 'positive')::int,
+               (sentiment = 'neutral')::int,
+               (sentiment = 'negative')::int
+        FROM new_interaction
+        ON CONFLICT (contact_id, day) DO UPDATE
+        SET interactions = d.interactions + EXCLUDED.interactions,
+            positive     = d.positive + EXCLUDED.positive,
+            neutral      = d.neutral + EXCLUDED.neutral,
+            negative     = d.negative + EXCLUDED.negative
+    ),
+    touched AS (
+        UPDATE contacts AS c
+        SET last_interaction_date = GREATEST(c.last_interaction_date, n.date),
+            updated_at = now()
+        FROM new_interaction n
+        WHERE c.id = n.contact_id
+    )
+    SELECT id::text AS id,
+           contact_id,
+           date,
+           type,
+           notes,
+           sentiment,
+           follow_up_needed,
+           follow_up_date
+    FROM new_interaction;
+    """,
+)
+
+
+async def insert_interaction(
+    conn: asyncpg.Connection,
+    contact_id: int,
+    data: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """
+    Log an interaction and fold it into the contact's aggregates in the
+    same statement: the daily rollup row is upserted and the contact's
+    last_interaction_date moves forward. Returns None if the contact
+    does not exist.
+    """
+    row = await statements.fetchrow(
+        conn,
+        INSERT_INTERACTION,
+        contact_id,
+        data["date"],
+        data["type"],
+        data.get("notes", ""),
+        data.get("sentiment", "neutral"),
+        data.get("follow_up_needed", False),
+        data.get("follow_up_date"),
+    )
+    return dict(row) if row else None
+
+
+CONTACT_AGGREGATES = statements.register(
+    "contacts.aggregates",
+    f"""
+    SELECT {CONTACT_COLUMNS},
+           COALESCE(y.interactions, 0) + COALESCE(b.interactions, 0)
+               AS interactions_last_year,
+           COALESCE(r.positive, 0) AS recent_positive,
+           COALESCE(r.neutral, 0)  AS recent_neutral,
+           COALESCE(r.negative, 0) AS recent_negative
+    FROM contacts c
+    LEFT JOIN (
+        SELECT contact_id, sum(interactions) AS interactions
+        FROM contact_interaction_daily
+        WHERE day > $2
+        GROUP BY contact_id
+    ) y ON y.contact_id = c.id
+    LEFT JOIN (
+        SELECT contact_id, count(*) AS interactions
+        FROM contact_interactions
+        WHERE date > $1 AND date < $2 + 1
+        GROUP BY contact_id
+    ) b ON b.contact_id = c.id
+    LEFT JOIN (
+        SELECT contact_id,
+               sum(positive) AS positive,
+               sum(neutral)  AS neutral,
+               sum(negative) AS negative
+        FROM contact_interaction_daily
+        WHERE day >= $3
+        GROUP BY contact_id
+    ) r ON r.contact_id = c.id
+    ORDER BY c.id;
+    """,
+)
+
+
+async def fetch_contact_aggregates(
+    conn: asyncpg.Connection,
+    year_ago: datetime,
+    sentiment_since: date,
+) -> List[asyncpg.Record]:
+    """
+    Every contact with the inputs ContactPrioritization needs, computed
+    from the daily rollup:
+      interactions_last_year  interactions dated after `year_ago`
+      recent_positive/neutral/negative  sentiment mix since `sentiment_since`
+    Whole days after year_ago come from the rollup; only the boundary day
+    reads raw interactions, so the count matches the in-memory formula.
+    """
+    return await statements.fetch(
+        conn,
+        CONTACT_AGGREGATES,
+        year_ago,
+        year_ago.date(),
+        sentiment_since,
     )
-    return dict(row) if row else {}
+
+
+# -------- Priority score store persistence --------
+# PriorityScoreStore lives in each worker's memory; these tables are the
+# shared record it is rebuilt and caught up from.
+
+BUMP_SCORE_STORE_VERSION = statements.register(
+    "score_store.bump_version",
+    """
+    INSERT INTO priority_store_versions (owner, version)
+    VALUES ($1, 1)
+    ON CONFLICT (owner) DO UPDATE
+        SET version = priority_store_versions.version + 1
+    RETURNING version;
+    """,
+)
+
+UPSERT_SCORE_STORE_CONTACTS = statements.register(
+    "score_store.upsert_contacts",
+    """
+    INSERT INTO priority_store_contacts (owner, contact_id, contact, version)
+    SELECT $1, c.contact_id, c.contact, $4
+    FROM unnest($2::bigint[], $3::jsonb[]) AS c(contact_id, contact)
+    ON CONFLICT (owner, contact_id) DO UPDATE
+        SET contact = EXCLUDED.contact,
+            version = EXCLUDED.version;
+    """,
+)
+
+INSERT_SCORE_STORE_INTERACTIONS = statements.register(
+    "score_store.insert_interactions",
+    """
+    INSERT INTO priority_store_interactions (owner, interaction, version)
+    SELECT $1, i.interaction, $3
+    FROM unnest($2::jsonb[]) WITH ORDINALITY AS i(interaction, n)
+    ORDER BY i.n;
+    """,
+)
+
+SCORE_STORE_VERSION = statements.register(
+    "score_store.version",
+    """
+    SELECT version
+    FROM priority_store_versions
+    WHERE owner = $1;
+    """,
+)
+
+SCORE_STORE_CONTACTS_SINCE = statements.register(
+    "score_store.contacts_since",
+    """
+    SELECT contact::text AS contact
+    FROM priority_store_contacts
+    WHERE owner = $1
+      AND version > $2
+      AND version <= $3
+    ORDER BY version, contact_id;
+    """,
+)
+
+SCORE_STORE_INTERACTIONS_SINCE = statements.register(
+    "score_store.interactions_since",
+    """
+    SELECT interaction::text AS interaction
+    FROM priority_store_interactions
+    WHERE owner = $1
+      AND version > $2
+      AND version <= $3
+    ORDER BY version, id;
+    """,
+)
+
+
+async def save_score_store_changes(
+    conn: asyncpg.Connection,
+    owner: str,
+    contacts: List[Tuple[int, str]],
+    interactions: List[str],
+) -> int:
+    """
+    Record one sync: contacts as (id, JSON) pairs replacing earlier
+    versions, interactions as JSON appended in order. Returns the owner's
+    new version. The version row lock orders concurrent syncs, so
+    versions become visible in the order they were assigned.
+    """
+    async with conn.transaction():
+        version = await statements.fetchval(conn, BUMP_SCORE_STORE_VERSION, owner)
+        if contacts:
+            await statements.execute(
+                conn,
+                UPSERT_SCORE_STORE_CONTACTS,
+                owner,
+                [contact_id for contact_id, _ in contacts],
+                [contact for _, contact in contacts],
+                version,
+            )
+        if interactions:
+            await statements.execute(conn, INSERT_SCORE_STORE_INTERACTIONS, owner, interactions, version)
+    return version
+
+
+async def load_score_store_changes(
+    conn: asyncpg.Connection,
+    owner: str,
+    since_version: int,
+) -> Tuple[int, List[str], List[str]]:
+    """
+    Changes recorded after `since_version`, read from one snapshot:
+    (current_version, contact JSON, interaction JSON in logged order).
+    Returns no rows when the caller is already current.
+    """
+    async with conn.transaction(isolation="repeatable_read", readonly=True):
+        version = await statements.fetchval(conn, SCORE_STORE_VERSION, owner) or 0
+        if version <= since_version:
+            return version, [], []
+        contacts = await statements.fetch(conn, SCORE_STORE_CONTACTS_SINCE, owner, since_version, version)
+        interactions = await statements.fetch(
+            conn, SCORE_STORE_INTERACTIONS_SINCE, owner, since_version, version
+        )
+    return version, [r["contact"] for r in contacts], [r["interaction"] for r in interactions]
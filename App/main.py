@@ -1,10 +1,35 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
+from app.config import settings
+from app.db import init_db_pool, close_db_pool, pool_stats, pool_metrics_lines
+from app.metrics import start_request_stats, end_request_stats
+from app.statements import statements
+from app.cache import listing_cache
 from app.schemas import HealthResponse
+from app.services.eventbrite import close_http_client
+from app.services.sharding import shutdown_sharded_prioritizer
 from app.routers import contacts, jobs, planner
 
-app = FastAPI(title="PropelMe Backend")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_db_pool()
+    await listing_cache.start()
+    try:
+        yield
+    finally:
+        await listing_cache.stop()
+        await close_db_pool()
+        # Worker processes and the Eventbrite client are created lazily
+        shutdown_sharded_prioritizer()
+        await close_http_client()
+
+
+app = FastAPI(title="PropelMe Backend", lifespan=lifespan)
 
 # CORS – adjust origins as needed
 origins = [
@@ -19,12 +44,47 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Keyset pagination cursor for GET /jobs/ and GET /planner/tasks
+    expose_headers=["X-Next-Cursor"],
 )
 
+if settings.db_debug_summary:
+    @app.middleware("http")
+    async def db_summary_header(request: Request, call_next):
+        """Report each request's queries, DB time and acquire wait in X-DB-Summary."""
+        stats, token = start_request_stats()
+        try:
+            response = await call_next(request)
+        finally:
+            end_request_stats(token)
+        response.headers["X-DB-Summary"] = stats.header()
+        return response
+
 @app.get("/health", response_model=HealthResponse)
 async def health():
     return HealthResponse(status="ok")
 
+@app.get("/health/db")
+async def health_db():
+    """Connection pool usage: size, in use, idle and waiting requests."""
+    return pool_stats()
+
+@app.get("/health/db/statements")
+async def health_db_statements():
+    """Per-statement calls, errors, rows and time from the statement registry."""
+    return statements.stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Query latency histograms, row / error counts and pool usage for Prometheus."""
+    lines = statements.prometheus_lines() + pool_metrics_lines()
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+@app.get("/health/cache")
+async def health_cache():
+    """Listing cache size and hit / miss / eviction / invalidation counts."""
+    return listing_cache.stats()
+
 # Routers
 app.include_router(contacts.router)
 app.include_router(jobs.router)
@@ -0,0 +1,127 @@
+# App/metrics.py
+import contextvars
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Latency bucket upper bounds in seconds (Prometheus convention)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram. Observations are O(log buckets); percentiles
+    are estimated from bucket bounds, which is enough to spot slow queries.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, cumulative count) pairs including +Inf"""
+        out = []
+        running = 0
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            running += count
+            out.append(("+Inf" if bound == float("inf") else repr(bound), running))
+        return out
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        running = 0
+        for i, count in enumerate(self.counts):
+            running += count
+            if running >= rank:
+                return self.bounds[i] if i < len(self.bounds) else float("inf")
+        return float("inf")
+
+
+# -------- Per-request summary --------
+# The debug middleware puts a fresh RequestDbStats in this context variable;
+# query and acquire timings anywhere in that request are added to it.
+
+class RequestDbStats:
+    __slots__ = ("queries", "db_seconds", "acquire_seconds", "by_name")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.acquire_seconds = 0.0
+        self.by_name: Dict[str, List[float]] = {}  # name -> [calls, seconds]
+
+    def add_query(self, name: str, seconds: float) -> None:
+        self.queries += 1
+        self.db_seconds += seconds
+        entry = self.by_name.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def header(self) -> str:
+        """Compact one-line summary, e.g. for an X-DB-Summary header"""
+        parts = [
+            f"queries={self.queries}",
+            f"db_ms={self.db_seconds * 1000:.2f}",
+            f"acquire_ms={self.acquire_seconds * 1000:.2f}",
+        ]
+        parts.extend(
+            f"{name}={int(calls)}x{seconds * 1000:.2f}ms"
+            for name, (calls, seconds) in self.by_name.items()
+        )
+        return "; ".join(parts)
+
+
+_request_stats: contextvars.ContextVar[Optional[RequestDbStats]] = contextvars.ContextVar(
+    "request_db_stats", default=None
+)
+
+
+def start_request_stats() -> Tuple[RequestDbStats, contextvars.Token]:
+    stats = RequestDbStats()
+    return stats, _request_stats.set(stats)
+
+
+def end_request_stats(token: contextvars.Token) -> None:
+    _request_stats.reset(token)
+
+
+def current_request_stats() -> Optional[RequestDbStats]:
+    return _request_stats.get()
+
+
+# -------- Prometheus text exposition --------
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_histogram(name: str, help_text: str, series: Iterable[Tuple[Dict[str, str], Histogram]]) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for labels, hist in series:
+        label_str = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+        sep = "," if label_str else ""
+        suffix = f"{{{label_str}}}" if label_str else ""
+        for le, count in hist.cumulative():
+            lines.append(f'{name}_bucket{{{label_str}{sep}le="{le}"}} {count}')
+        lines.append(f"{name}_sum{suffix} {hist.sum}")
+        lines.append(f"{name}_count{suffix} {hist.count}")
+    return lines
+
+
+def render_metric(name: str, kind: str, help_text: str, series: Iterable[Tuple[Dict[str, str], float]]) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in series:
+        label_str = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+        lines.append(f"{name}{{{label_str}}} {value}" if label_str else f"{name} {value}")
+    return lines
@@ -1,7 +1,7 @@
 cat > app.schemas.py << 'EOF'
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AliasChoices, BaseModel, EmailStr, Field
 from typing import Optional, Literal, List
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 
 # Your existing types
@@ -79,6 +79,40 @@ class JobApplication(JobApplicationBase):
     class Config:
         from_attributes = True
 
+class JobStatusUpdate(BaseModel):
+    id: int
+    status: str
+    notes_append: Optional[str] = None
+
+class BulkJobStatusRequest(BaseModel):
+    updates: List[JobStatusUpdate] = Field(..., min_length=1, max_length=1000)
+
+class BulkJobStatusResponse(BaseModel):
+    updated: List[JobApplication]
+    not_found: List[int] = []
+
+class JobImportRow(BaseModel):
+    """One row of a CSV / NDJSON job import; spreadsheet column names are accepted too"""
+    company: str = Field(..., min_length=1)
+    role_title: str = Field(..., min_length=1, validation_alias=AliasChoices("role_title", "job_title"))
+    link: str = Field(default="", validation_alias=AliasChoices("link", "job_link"))
+    status: str = "Planned"
+    contact_name: str = ""
+    contact_linkedin_url: str = ""
+    notes: str = ""
+
+class JobImportError(BaseModel):
+    line: int
+    error: str
+
+class JobImportResponse(BaseModel):
+    received: int
+    inserted: int
+    duplicates: int
+    invalid: int
+    errors: List[JobImportError] = []
+    errors_truncated: bool = False
+
 class PlannerTask(BaseModel):
     id: Optional[int] = None
     contact_id: int
@@ -89,6 +123,20 @@ class PlannerTask(BaseModel):
     class Config:
         from_attributes = True
 
+class PlannerReschedule(BaseModel):
+    id: int
+    due_date: date
+
+class PlannerBulkRequest(BaseModel):
+    complete: List[int] = Field(default=[], max_length=1000)
+    reschedule: List[PlannerReschedule] = Field(default=[], max_length=1000)
+
+class PlannerBulkResponse(BaseModel):
+    completed: List[PlannerTask]
+    rescheduled: List[PlannerTask]
+    already_completed: List[int] = []
+    not_found: List[int] = []
+
 # New models for extended functionality
 class Interaction(BaseModel):
     id: Optional[str] = None
@@ -113,12 +161,23 @@ class UserProfile(BaseModel):
 class PrioritizeRequest(BaseModel):
     contacts: List[Contact]
     interactions: Optional[List[Interaction]] = None
-    limit: Optional[int] = None
+    limit: Optional[int] = Field(default=None, ge=1)
 
 class ScheduleRequest(BaseModel):
     contacts: List[Contact]
     interactions: Optional[List[Interaction]] = None
     contacts_per_week: int = 5
+    # Paged mode: return `weeks` weeks at a time, continuing from `cursor`
+    weeks: Optional[int] = Field(default=None, ge=1)
+    cursor: Optional[str] = None
+
+class ScoreStoreSyncRequest(BaseModel):
+    contacts: List[Contact] = []
+    interactions: Optional[List[Interaction]] = None  # newly logged only
+
+class WarmthBatchRequest(BaseModel):
+    contacts: List[Contact]
+    interactions: List[Interaction] = []
 
 class MessageRequest(BaseModel):
     contact_name: str
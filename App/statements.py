@@ -0,0 +1,232 @@
+# App/statements.py
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import asyncpg
+
+from .config import get_settings
+from .metrics import Histogram, current_request_stats, render_histogram, render_metric
+
+logger = logging.getLogger(__name__)
+
+
+def _bound_ms(seconds: float) -> Optional[float]:
+    return None if seconds == float("inf") else round(seconds * 1000, 3)
+
+
+class Statement:
+    """
+    A named SQL statement plus its usage counters.
+    """
+
+    __slots__ = ("name", "sql", "prepare", "calls", "errors", "rows", "total_seconds", "latency")
+
+    def __init__(self, name: str, sql: str, prepare: bool = True):
+        self.name = name
+        self.sql = sql
+        self.prepare = prepare
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_seconds = 0.0
+        self.latency = Histogram()
+
+    def record(self, seconds: float, rows: int) -> None:
+        self.calls += 1
+        self.rows += rows
+        self.total_seconds += seconds
+        self.latency.observe(seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds * 1000 / self.calls, 3) if self.calls else 0.0,
+            # Bucket upper bounds, not exact percentiles (None = above the last bucket)
+            "p50_ms_le": _bound_ms(self.latency.quantile(0.5)),
+            "p95_ms_le": _bound_ms(self.latency.quantile(0.95)),
+            "p99_ms_le": _bound_ms(self.latency.quantile(0.99)),
+        }
+
+
+def _status_rows(status: str) -> int:
+    """Row count from a command tag such as 'UPDATE 3' or 'INSERT 0 1'"""
+    last = status.rsplit(" ", 1)[-1]
+    return int(last) if last.isdigit() else 0
+
+
+async def _call(prepared, method: str, args) -> Any:
+    if method == "execute":
+        # PreparedStatement has no execute(); run it and return the command tag
+        await prepared.fetch(*args)
+        return prepared.get_statusmsg()
+    return await getattr(prepared, method)(*args)
+
+
+class StatementRegistry:
+    """
+    Central registry of the SQL the app runs.
+
+    Statements are registered once at import time under a dotted name and
+    executed by name. Each pooled connection prepares every statement when
+    it is opened (see prepare_all, used as the pool's init callback), so
+    queries are parsed and planned once per connection instead of per call.
+    Statements registered with prepare=False (DDL, or SQL over temp tables
+    that only exist inside a transaction) are sent as text but still counted.
+
+    Every execution feeds the statement's latency histogram, the current
+    request's summary (when the debug middleware is on) and, above
+    `slow_query_ms`, a warning in the log.
+    """
+
+    def __init__(self, slow_query_ms: float = 250.0):
+        self.slow_query_seconds = slow_query_ms / 1000
+        self._statements: Dict[str, Statement] = {}
+        # backend pid -> {name: PreparedStatement}; a pid reused by a new
+        # backend is overwritten when prepare_all runs for that connection
+        self._prepared: Dict[int, Dict[str, asyncpg.prepared_stmt.PreparedStatement]] = {}
+
+    def register(self, name: str, sql: str, prepare: bool = True) -> str:
+        if name in self._statements:
+            raise ValueError(f"Statement {name!r} is already registered")
+        self._statements[name] = Statement(name, sql, prepare)
+        return name
+
+    def sql(self, name: str) -> str:
+        return self._statements[name].sql
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._statements
+
+    # -------- Preparation --------
+
+    async def prepare_all(self, conn: asyncpg.Connection) -> None:
+        """
+        Prepare every registered statement on a new connection. Statements
+        whose tables do not exist yet are skipped and prepared on first use.
+        """
+        prepared = {}
+        for stmt in self._statements.values():
+            if not stmt.prepare:
+                continue
+            try:
+                prepared[stmt.name] = await conn.prepare(stmt.sql)
+            except asyncpg.PostgresError as e:
+                logger.warning("Could not prepare %s: %s", stmt.name, e)
+        self._prepared[conn.get_server_pid()] = prepared
+        conn.add_termination_listener(self.forget)
+
+    def forget(self, conn: asyncpg.Connection) -> None:
+        """Drop cached statements for a closed connection"""
+        self._prepared.pop(conn.get_server_pid(), None)
+
+    async def _get_prepared(self, conn: asyncpg.Connection, stmt: Statement, refresh: bool = False):
+        cache = self._prepared.setdefault(conn.get_server_pid(), {})
+        prepared = None if refresh else cache.get(stmt.name)
+        if prepared is None:
+            prepared = cache[stmt.name] = await conn.prepare(stmt.sql)
+        return prepared
+
+    async def _run(self, conn: asyncpg.Connection, name: str, method: str, args, count) -> Any:
+        stmt = self._statements[name]
+        start = time.perf_counter()
+        try:
+            if not stmt.prepare:
+                result = await getattr(conn, method)(stmt.sql, *args)
+            else:
+                prepared = await self._get_prepared(conn, stmt)
+                try:
+                    result = await _call(prepared, method, args)
+                except asyncpg.InvalidCachedStatementError:
+                    # Schema changed under the prepared plan; prepare again once
+                    prepared = await self._get_prepared(conn, stmt, refresh=True)
+                    result = await _call(prepared, method, args)
+        except Exception:
+            stmt.errors += 1
+            raise
+        self._record(stmt, time.perf_counter() - start, count(result), args)
+        return result
+
+    def _record(self, stmt: Statement, seconds: float, rows: int, args) -> None:
+        stmt.record(seconds, rows)
+        request_stats = current_request_stats()
+        if request_stats is not None:
+            request_stats.add_query(stmt.name, seconds)
+        if seconds >= self.slow_query_seconds:
+            logger.warning(
+                "Slow query %s: %.1f ms, %d rows, %d params",
+                stmt.name, seconds * 1000, rows, len(args),
+            )
+
+    # -------- Execution --------
+
+    async def fetch(self, conn: asyncpg.Connection, name: str, *args) -> List[asyncpg.Record]:
+        return await self._run(conn, name, "fetch", args, len)
+
+    async def fetchrow(self, conn: asyncpg.Connection, name: str, *args) -> Optional[asyncpg.Record]:
+        return await self._run(conn, name, "fetchrow", args, lambda row: 0 if row is None else 1)
+
+    async def fetchval(self, conn: asyncpg.Connection, name: str, *args) -> Any:
+        return await self._run(conn, name, "fetchval", args, lambda _: 1)
+
+    async def execute(self, conn: asyncpg.Connection, name: str, *args) -> str:
+        """Run a statement for its effect; returns the command tag"""
+        return await self._run(conn, name, "execute", args, _status_rows)
+
+    async def cursor(
+        self,
+        conn: asyncpg.Connection,
+        name: str,
+        *args,
+        prefetch: Optional[int] = None,
+    ) -> AsyncIterator[asyncpg.Record]:
+        """
+        Iterate a server-side cursor over a prepared statement (must run
+        inside a transaction). Timing covers the whole iteration.
+        """
+        stmt = self._statements[name]
+        prepared = await self._get_prepared(conn, stmt)
+        start = time.perf_counter()
+        rows = 0
+        try:
+            async for record in prepared.cursor(*args, prefetch=prefetch):
+                rows += 1
+                yield record
+        except Exception:
+            stmt.errors += 1
+            raise
+        finally:
+            self._record(stmt, time.perf_counter() - start, rows, args)
+
+    # -------- Monitoring --------
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stmt.stats() for name, stmt in self._statements.items()}
+
+    def prometheus_lines(self) -> List[str]:
+        used = [stmt for stmt in self._statements.values() if stmt.calls or stmt.errors]
+        return [
+            *render_histogram(
+                "propelme_db_query_duration_seconds",
+                "Latency of named database statements.",
+                (({"query": stmt.name}, stmt.latency) for stmt in used),
+            ),
+            *render_metric(
+                "propelme_db_query_rows_total",
+                "counter",
+                "Rows returned or affected by named database statements.",
+                (({"query": stmt.name}, stmt.rows) for stmt in used),
+            ),
+            *render_metric(
+                "propelme_db_query_errors_total",
+                "counter",
+                "Failed executions of named database statements.",
+                (({"query": stmt.name}, stmt.errors) for stmt in used),
+            ),
+        ]
+
+
+statements = StatementRegistry(slow_query_ms=get_settings().db_slow_query_ms)
@@ -0,0 +1,144 @@
+"""
+Benchmark for App/encoding.py: response encoding of DB row listings.
+
+Compares, per page size, the path a `response_model=List[...]` endpoint
+takes when it returns plain rows (validate every row with Pydantic, dump
+to JSON-compatible Python, json.dumps) with RowsResponse, which encodes
+the rows straight to bytes. Both produce the same JSON document.
+
+Run from the repository root:
+    python -m benchmarks.bench_encoding
+    python -m benchmarks.bench_encoding --sizes 100 500 --repeat 20
+"""
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from App.Schemas import Contact, JobApplication, PlannerTask
+from App.encoding import RowsResponse, orjson
+
+DEFAULT_SIZES = [100, 500, 5_000]
+STATUSES = ["Planned", "Applied", "Interview", "Offer", "Rejected"]
+ACTIONS = ["check_profile", "comment", "message", "coffee_chat"]
+
+
+def job_rows(n: int, rnd: random.Random) -> List[Dict[str, Any]]:
+    """Rows as list_job_applications returns them"""
+    return [
+        {
+            "id": n - i,
+            "company": f"Company {rnd.randrange(500)}",
+            "role_title": rnd.choice(["Data Engineer", "Product Manager", "Backend Engineer"]),
+            "link": f"https://jobs.example.com/{rnd.randrange(10**6)}",
+            "status": rnd.choice(STATUSES),
+            "contact_name": "Alex Doe",
+            "contact_linkedin_url": "https://linkedin.com/in/alexdoe",
+            "notes": "Referred by a former colleague.\nFollow up next week.",
+        }
+        for i in range(n)
+    ]
+
+
+def planner_rows(n: int, rnd: random.Random) -> List[Dict[str, Any]]:
+    """Rows as list_planner_tasks returns them"""
+    today = datetime.now().date()
+    return [
+        {
+            "id": i + 1,
+            "contact_id": rnd.randrange(1, 5000),
+            "action_type": rnd.choice(ACTIONS),
+            "due_date": (today + timedelta(days=rnd.randrange(-30, 60))).isoformat(),
+            "completed": rnd.random() < 0.2,
+        }
+        for i in range(n)
+    ]
+
+
+def contact_rows(n: int, rnd: random.Random) -> List[Dict[str, Any]]:
+    """Rows as fetch_contact_aggregates returns them (aggregate columns omitted)"""
+    now = datetime.now()
+    return [
+        {
+            "id": i + 1,
+            "name": f"Contact {i + 1}",
+            "email": None,
+            "linkedin_url": f"https://linkedin.com/in/contact{i + 1}",
+            "company": f"Company {rnd.randrange(500)}",
+            "title": "Engineer",
+            "location": "Remote",
+            "relationship": rnd.choice(["friend", "acquaintance", "met_once", None]),
+            "warmth_score": round(rnd.random() * 100, 1),
+            "last_interaction_date": now - timedelta(days=rnd.randrange(400)),
+            "source": "manual",
+            "tags": ["alumni"],
+            "notes": None,
+            "created_at": now,
+            "updated_at": now,
+            "priority_score": round(rnd.random() * 100, 3),
+        }
+        for i in range(n)
+    ]
+
+
+def response_model_path(adapter: TypeAdapter) -> Callable[[list], bytes]:
+    """What FastAPI does with a returned list under response_model"""
+
+    def encode(rows):
+        validated = adapter.validate_python(rows)
+        content = adapter.dump_python(validated, mode="json")
+        return JSONResponse(content).body
+
+    return encode
+
+
+def rows_response_path(rows) -> bytes:
+    return RowsResponse(rows).body
+
+
+def _best_time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Row listing encoding benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    listings = {
+        "jobs": (job_rows, TypeAdapter(List[JobApplication])),
+        "planner": (planner_rows, TypeAdapter(List[PlannerTask])),
+        "contacts": (contact_rows, TypeAdapter(List[Contact])),
+    }
+
+    print(f"encoder: {'orjson' if orjson is not None else 'json'}")
+    print(f"{'listing':<10} {'rows':>7} {'response_model':>16} {'RowsResponse':>14} {'speedup':>9}")
+    for name, (make_rows, adapter) in listings.items():
+        slow = response_model_path(adapter)
+        for n in args.sizes:
+            rows = make_rows(n, rnd)
+            if name != "contacts":
+                # Contact adds defaulted fields, so only compare exact-shape listings
+                assert json.loads(slow(rows)) == json.loads(rows_response_path(rows))
+            before = _best_time(lambda: slow(rows), args.repeat)
+            after = _best_time(lambda: rows_response_path(rows), args.repeat)
+            print(
+                f"{name:<10} {n:>7} {before * 1000:>14.2f}ms {after * 1000:>12.2f}ms {before / after:>8.1f}x",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
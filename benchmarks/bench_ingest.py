@@ -0,0 +1,61 @@
+"""
+Bulk ingest benchmark: full Pydantic validation vs the fast decode path.
+
+Run from the repository root:
+    python -m benchmarks.bench_ingest
+    python -m benchmarks.bench_ingest --sizes 1000 50000 --repeat 5
+"""
+import argparse
+import json
+import time
+
+from App.Schemas import PrioritizeRequest
+from App.Services.bulk_decode import decode_prioritize_payload
+from App.Services.prioritization import ContactPrioritization
+
+from .synthetic import generate_rows, to_json_payload
+
+
+def make_payload(n_contacts: int) -> bytes:
+    contacts, interactions = generate_rows(n_contacts)
+    for i, contact in enumerate(contacts):
+        contact["email"] = f"contact{i}@example.com"
+    return json.dumps(to_json_payload(contacts, interactions, limit=50)).encode()
+
+
+def validated_path(body: bytes, prioritizer: ContactPrioritization):
+    request = PrioritizeRequest.model_validate_json(body)
+    return prioritizer.prioritize_contacts(request.contacts, request.interactions, request.limit)
+
+
+def fast_path(body: bytes, prioritizer: ContactPrioritization):
+    payload = decode_prioritize_payload(body)
+    return prioritizer.prioritize_contacts(payload["contacts"], payload["interactions"], payload["limit"])
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    prioritizer = ContactPrioritization()
+    print(f"{'contacts':>10} {'validated (s)':>14} {'fast (s)':>10} {'speedup':>8}")
+    for n in args.sizes:
+        body = make_payload(n)
+        slow = best_of(lambda: validated_path(body, prioritizer), args.repeat)
+        fast = best_of(lambda: fast_path(body, prioritizer), args.repeat)
+        print(f"{n:>10} {slow:>14.3f} {fast:>10.3f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
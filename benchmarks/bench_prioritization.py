@@ -0,0 +1,174 @@
+"""
+Benchmark suite for App/Services/prioritization.py.
+
+Measures throughput (contacts/s, best of --repeat runs) and peak traced
+memory for each scoring operation at several network sizes, and compares
+them with the stored baselines in benchmarks/baselines.json. Exits with
+status 1 when any operation is slower or uses more memory than its
+baseline allows, so it can gate a local run before pushing. A result
+with no stored baseline also fails the comparison.
+
+The model-based operations stop at MAX_MODEL_SIZE contacts: above that
+the Pydantic models alone exhaust memory, so larger sizes only run the
+columnar operations on data generated directly as NumPy columns.
+
+Run from the repository root:
+    python -m benchmarks.bench_prioritization
+    python -m benchmarks.bench_prioritization --sizes 1000 10000
+    python -m benchmarks.bench_prioritization --update-baselines
+
+Baselines are machine-specific: refresh them with --update-baselines on
+the machine you compare against.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from App.Services.interaction_index import InteractionIndex
+from App.Services.prioritization import ContactColumns, ContactPrioritization, top_k_indices
+
+from .synthetic import generate_columns, generate_models
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+MAX_MODEL_SIZE = 100_000
+
+
+def _operations(prioritizer: ContactPrioritization, contacts, interactions) -> Dict[str, Callable[[], object]]:
+    """Each operation includes the per-request setup its endpoint pays for"""
+
+    def calculate_priority_score():
+        index = InteractionIndex(interactions)
+        now = datetime.now()
+        for contact in contacts:
+            prioritizer.calculate_priority_score(contact, index, now)
+
+    return {
+        "calculate_priority_score": calculate_priority_score,
+        "prioritize_contacts": lambda: prioritizer.prioritize_contacts(contacts, interactions),
+        "prioritize_contacts_top50": lambda: prioritizer.prioritize_contacts(contacts, interactions, 50),
+        "generate_outreach_schedule": lambda: prioritizer.generate_outreach_schedule(contacts, interactions),
+        "calculate_warmth_score": lambda: prioritizer.calculate_warmth_scores(contacts, interactions),
+    }
+
+
+def _columnar_operations(prioritizer: ContactPrioritization, columns: ContactColumns) -> Dict[str, Callable[[], object]]:
+    """Scoring from prebuilt columns, without the model-to-column conversion"""
+    return {
+        "score_columns": lambda: prioritizer.score_columns(columns),
+        "score_columns_top50": lambda: top_k_indices(prioritizer.score_columns(columns), 50),
+    }
+
+
+def _best_time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(fn: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes: List[int], repeat: int, only: List[str]) -> Dict[str, Dict[str, float]]:
+    prioritizer = ContactPrioritization()
+    results = {}
+    for n in sizes:
+        operations = _columnar_operations(prioritizer, generate_columns(n))
+        if n <= MAX_MODEL_SIZE:
+            contacts, interactions = generate_models(n)
+            operations.update(_operations(prioritizer, contacts, interactions))
+        for name, fn in operations.items():
+            if only and name not in only:
+                continue
+            seconds = _best_time(fn, repeat)
+            peak = _peak_memory(fn)
+            results[f"{name}@{n}"] = {
+                "throughput": round(n / seconds, 1),
+                "peak_mb": round(peak / 2**20, 2),
+            }
+            print(
+                f"{name:<28} {n:>9} {seconds:>9.3f}s {n / seconds:>13,.0f}/s {peak / 2**20:>9.1f} MB",
+                flush=True,
+            )
+        del operations
+    return results
+
+
+def compare(results, baselines, tolerance: float) -> List[str]:
+    regressions = []
+    for key, current in results.items():
+        base = baselines.get(key)
+        if base is None:
+            regressions.append(f"{key}: no baseline (run with --update-baselines)")
+            continue
+        if current["throughput"] < base["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{key}: throughput {current['throughput']:,.0f}/s vs baseline {base['throughput']:,.0f}/s"
+            )
+        if current["peak_mb"] > base["peak_mb"] * (1 + tolerance):
+            regressions.append(
+                f"{key}: peak memory {current['peak_mb']} MB vs baseline {base['peak_mb']} MB"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prioritization service benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", default=[], help="operation names to run")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative slowdown / memory growth (default 0.25)")
+    parser.add_argument("--update-baselines", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'operation':<28} {'contacts':>9} {'time':>10} {'throughput':>15} {'peak':>12}")
+    results = run(args.sizes, args.repeat, args.only)
+
+    stored = {"meta": {}, "results": {}}
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH) as f:
+            stored = json.load(f)
+
+    if args.update_baselines:
+        stored["results"].update(results)
+        stored["meta"] = {
+            "machine": platform.platform(),
+            "python": platform.python_version(),
+            "updated": datetime.now().isoformat(timespec="seconds"),
+        }
+        with open(BASELINES_PATH, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baselines written to {BASELINES_PATH}")
+        return
+
+    regressions = compare(results, stored["results"], args.tolerance)
+    if regressions:
+        print("\nPerformance regressions:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print("\nNo regressions against baselines.")
+
+
+if __name__ == "__main__":
+    main()
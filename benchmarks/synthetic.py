@@ -0,0 +1,162 @@
+"""
+Synthetic contacts and interactions with realistic shapes for benchmarks.
+
+- relationship: most of a LinkedIn network is weak ties (acquaintance,
+  met_once, never_met); close friends are rare; ~10% have none set.
+- last_interaction_date: ~15% never contacted, the rest exponential with
+  a ~120 day mean, so every recency bucket is populated.
+- interactions: heavy-tailed per contact (a few contacts get most of
+  them), dates skewed recent, mostly email/LinkedIn, sentiment ~50%
+  positive / 40% neutral / 10% negative.
+
+generate_columns draws the same distributions straight into NumPy
+columns, for sizes where millions of Pydantic models do not fit in memory.
+"""
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from App.Schemas import Contact, Interaction, RelationshipType
+from App.Services.prioritization import RELATIONSHIP_CODES, ContactColumns
+
+RELATIONSHIP_MIX = [
+    (RelationshipType.CLOSE_FRIEND, 2),
+    (RelationshipType.FRIEND, 6),
+    (RelationshipType.CURRENT_COLLEAGUE, 8),
+    (RelationshipType.FORMER_COLLEAGUE, 14),
+    (RelationshipType.ACQUAINTANCE, 25),
+    (RelationshipType.MET_ONCE, 20),
+    (RelationshipType.NEVER_MET, 15),
+    (None, 10),
+]
+INTERACTION_TYPES = [
+    ("email", 35), ("linkedin_message", 35), ("event", 12),
+    ("phone_call", 10), ("coffee", 8),
+]
+SENTIMENTS = [("positive", 50), ("neutral", 40), ("negative", 10)]
+
+
+def _choices(rnd: random.Random, weighted, k: int) -> list:
+    values, weights = zip(*weighted)
+    return rnd.choices(values, weights=weights, k=k)
+
+
+def _contact_rows(rnd: random.Random, n_contacts: int, now: datetime) -> Iterator[Dict[str, Any]]:
+    relationships = _choices(rnd, RELATIONSHIP_MIX, n_contacts)
+    for i in range(n_contacts):
+        last = None
+        if rnd.random() >= 0.15:
+            last = now - timedelta(days=rnd.expovariate(1 / 120))
+        warmth = 0.0 if rnd.random() < 0.3 else round(rnd.betavariate(2, 2) * 100, 1)
+        yield {
+            "id": i + 1,
+            "name": f"Contact {i + 1}",
+            "company": f"Company {rnd.randrange(max(1, n_contacts // 20))}",
+            "relationship": relationships[i],
+            "last_interaction_date": last,
+            "warmth_score": warmth,
+        }
+
+
+def _interaction_rows(
+    rnd: random.Random,
+    n_contacts: int,
+    n_interactions: int,
+    now: datetime,
+) -> Iterator[Dict[str, Any]]:
+    # Pareto-distributed contact popularity: a few contacts get most interactions
+    popularity = [rnd.paretovariate(1.2) for _ in range(n_contacts)]
+    owners = rnd.choices(range(1, n_contacts + 1), weights=popularity, k=n_interactions)
+    del popularity
+    types = _choices(rnd, INTERACTION_TYPES, n_interactions)
+    sentiments = _choices(rnd, SENTIMENTS, n_interactions)
+    for j in range(n_interactions):
+        yield {
+            "contact_id": owners[j],
+            "date": now - timedelta(days=rnd.expovariate(1 / 200)),
+            "type": types[j],
+            "notes": "",
+            "sentiment": sentiments[j],
+        }
+
+
+def generate_rows(
+    n_contacts: int,
+    interactions_per_contact: float = 3.0,
+    seed: int = 42,
+    now: Optional[datetime] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Plain dict rows (contacts, interactions); datetimes stay datetime objects"""
+    rnd = random.Random(seed)
+    now = now or datetime.now()
+    contacts = list(_contact_rows(rnd, n_contacts, now))
+    n_interactions = int(n_contacts * interactions_per_contact)
+    interactions = list(_interaction_rows(rnd, n_contacts, n_interactions, now))
+    return contacts, interactions
+
+
+def generate_models(
+    n_contacts: int,
+    interactions_per_contact: float = 3.0,
+    seed: int = 42,
+    now: Optional[datetime] = None,
+) -> Tuple[List[Contact], List[Interaction]]:
+    """Same data as generate_rows, as (unvalidated) Pydantic models"""
+    rnd = random.Random(seed)
+    now = now or datetime.now()
+    contacts = [Contact.model_construct(**row) for row in _contact_rows(rnd, n_contacts, now)]
+    n_interactions = int(n_contacts * interactions_per_contact)
+    interactions = [
+        Interaction.model_construct(**row)
+        for row in _interaction_rows(rnd, n_contacts, n_interactions, now)
+    ]
+    return contacts, interactions
+
+
+def generate_columns(
+    n_contacts: int,
+    interactions_per_contact: float = 3.0,
+    seed: int = 42,
+    now: Optional[datetime] = None,
+) -> ContactColumns:
+    """Same distributions as generate_models, drawn directly as ContactColumns"""
+    rng = np.random.default_rng(seed)
+    now64 = np.datetime64(now or datetime.now(), "us")
+    day = np.timedelta64(1, "D").astype("timedelta64[us]").astype(np.int64)
+
+    values, weights = zip(*RELATIONSHIP_MIX)
+    codes = np.array([RELATIONSHIP_CODES.get(rel, -1) for rel in values], dtype=np.int8)
+    relationship = codes[rng.choice(len(codes), size=n_contacts, p=np.array(weights) / sum(weights))]
+
+    age = (rng.exponential(120, n_contacts) * day).astype("timedelta64[us]")
+    last_interaction = now64 - age
+    last_interaction[rng.random(n_contacts) < 0.15] = np.datetime64("NaT")
+
+    warmth = np.round(rng.beta(2, 2, n_contacts) * 100, 1)
+    warmth[rng.random(n_contacts) < 0.3] = 0.0
+
+    # Interactions only matter to scoring as per-contact counts in the last year
+    n_interactions = int(n_contacts * interactions_per_contact)
+    popularity = rng.pareto(1.2, n_contacts) + 1
+    owners = rng.choice(n_contacts, size=n_interactions, p=popularity / popularity.sum())
+    recent = rng.exponential(200, n_interactions) < 365
+    interaction_count = np.bincount(owners[recent], minlength=n_contacts).astype(np.int64)
+
+    return ContactColumns(last_interaction, relationship, warmth, interaction_count)
+
+
+def to_json_payload(contacts: List[Dict[str, Any]], interactions: List[Dict[str, Any]], **extra) -> Dict[str, Any]:
+    """Request body shape of /contacts/prioritize with ISO date strings"""
+    def encode(row):
+        return {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in row.items()
+        }
+
+    return {
+        "contacts": [encode(c) for c in contacts],
+        "interactions": [encode(i) for i in interactions],
+        **extra,
+    }
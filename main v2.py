@@ -1,10 +1,19 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-import os
-import asyncpg
 
-app = FastAPI(title="PropelMe Backend")
+from App.db import get_db, init_db_pool, close_db_pool
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_db_pool()
+    try:
+        yield
+    finally:
+        await close_db_pool()
+
+app = FastAPI(title="PropelMe Backend", lifespan=lifespan)
 
 # CORS – allow your frontend + localhost for now
 origins = [
@@ -21,17 +30,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-DATABASE_URL = os.getenv("DB_CONNECTION_URL")
-
-async def get_db():
-    if not DATABASE_URL:
-        raise RuntimeError("DB_CONNECTION_URL not set")
-    conn = await asyncpg.connect(DATABASE_URL)
-    try:
-        yield conn
-    finally:
-        await conn.close()
-
 class HealthResponse(BaseModel):
     status: str
 
@@ -1,12 +1,41 @@
 cat > main.py << 'EOF'
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import os
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from App.db import close_db_pool
+    from App.Services.eventbrite import start_http_client, close_http_client
+    from App.Services.event_index import start_event_index_refresh, stop_event_index_refresh
+    from App.Services.sharding import shutdown_sharded_prioritizer
+    
+    # Every stop/close below is a no-op for what never started, so a
+    # failed startup still releases whatever did start
+    try:
+        # One pooled HTTP client for all Eventbrite calls
+        await start_http_client()
+        
+        # Background refresh of the local event index used by /events/*
+        await start_event_index_refresh()
+        
+        yield
+    finally:
+        await stop_event_index_refresh()
+        await close_http_client()
+        
+        # Stop worker processes used for sharded contact prioritization
+        shutdown_sharded_prioritizer()
+        
+        # Pool opened lazily by get_db on first use
+        await close_db_pool()
+
 app = FastAPI(
     title="PropelMe - AI Networking Agent",
     version="2.0",
-    description="Complete AI-powered networking platform with LinkedIn, Eventbrite, and smart prioritization"
+    description="Complete AI-powered networking platform with LinkedIn, Eventbrite, and smart prioritization",
+    lifespan=lifespan
 )
 
 app.add_middleware(
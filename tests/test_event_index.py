@@ -0,0 +1,92 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from App.Services import event_index
+from App.Services.event_index import EventIndex, SeedCoverage, seed_key
+
+NOW = datetime(2030, 1, 1, 9, 0)
+
+
+def _event(event_id, name, days):
+    return {"id": event_id, "name": name, "description": "", "start": (NOW + timedelta(days=days)).isoformat()}
+
+
+def _index(seeds, events=()):
+    return EventIndex(events, seeds=seeds, horizon=NOW + timedelta(days=60))
+
+
+def test_covers_exact_seed_keyword_within_last_start():
+    index = _index({seed_key("professional development"): SeedCoverage(False, NOW + timedelta(days=40))})
+
+    assert index.covers("Professional  Development", NOW + timedelta(days=30))
+    assert index.covers("development professional", NOW + timedelta(days=40))
+
+
+def test_rejects_token_subset_of_multi_word_seed():
+    index = _index({seed_key("professional development"): SeedCoverage(False, NOW + timedelta(days=40))})
+
+    assert not index.covers("development", NOW + timedelta(days=30))
+    assert not index.covers("professional development workshop", NOW + timedelta(days=30))
+
+
+def test_rejects_truncated_seed():
+    index = _index({seed_key("networking"): SeedCoverage(True, NOW + timedelta(days=40))})
+
+    assert not index.covers("networking", NOW + timedelta(days=1))
+
+
+def test_rejects_end_past_last_fetched_start():
+    index = _index({seed_key("networking"): SeedCoverage(False, NOW + timedelta(days=20))})
+
+    assert index.covers("networking", NOW + timedelta(days=20))
+    assert not index.covers("networking", NOW + timedelta(days=21))
+    assert not index.covers("networking", None)
+
+
+def test_merge_keeps_weakest_location_coverage():
+    a = SeedCoverage(False, NOW + timedelta(days=30))
+    b = SeedCoverage(True, NOW + timedelta(days=10))
+
+    merged = a.merge(b)
+    assert merged.truncated
+    assert merged.last_start == NOW + timedelta(days=10)
+
+
+class _FakeService:
+    """iter_events stand-in: `events` per keyword, optionally failing"""
+
+    def __init__(self, events, failing=()):
+        self.events = events
+        self.failing = set(failing)
+
+    async def iter_events(self, keywords, location=None, until=None, max_events=None, **kwargs):
+        if keywords in self.failing:
+            raise RuntimeError("boom")
+        for event in self.events.get(keywords, [])[:max_events]:
+            yield event
+
+
+def test_refresh_records_truncated_failed_and_complete_seeds(monkeypatch):
+    settings = event_index.settings
+    monkeypatch.setattr(settings, "event_index_keywords", "networking,technology,business")
+    monkeypatch.setattr(settings, "event_index_locations", None)
+    monkeypatch.setattr(settings, "event_index_max_events_per_query", 3)
+
+    service = _FakeService(
+        {
+            "networking": [_event(f"n{i}", "networking", i) for i in range(2)],
+            "technology": [_event(f"t{i}", "technology", i) for i in range(5)],
+        },
+        failing={"business"},
+    )
+    index = asyncio.run(event_index.refresh_event_index(service))
+
+    networking = index.seeds[seed_key("networking")]
+    assert not networking.truncated
+    assert networking.last_start == NOW + timedelta(days=1)
+    assert index.seeds[seed_key("technology")].truncated
+    assert index.seeds[seed_key("business")].truncated
+
+    assert index.covers("networking", NOW + timedelta(days=1))
+    assert not index.covers("technology", NOW + timedelta(days=1))
+    assert not index.covers("business", NOW + timedelta(days=1))